@@ -4,7 +4,9 @@ Vinted UK Sniper — Python Bridge
 Local HTTP server for Electron to call. Uses curl_cffi for stealth requests.
 """
 
+import asyncio
 import io
+from contextlib import asynccontextmanager
 from typing import Optional
 
 import uvicorn
@@ -14,13 +16,14 @@ from fastapi.responses import JSONResponse, Response
 
 from vinted_client import (
     VintedError,
-    search as vinted_search,
+    search_async as vinted_search,
+    search_many as vinted_search_many,
     fetch_item_json as vinted_fetch_item_json,
-    checkout_build as vinted_checkout_build,
-    checkout_put as vinted_checkout_put,
-    checkout_pay as vinted_checkout_pay,
-    nearby_pickup_points as vinted_nearby_pickup_points,
-    apply_rate_limit,
+    checkout_build_async as vinted_checkout_build,
+    checkout_put_async as vinted_checkout_put,
+    checkout_pay_async as vinted_checkout_pay,
+    nearby_pickup_points_async as vinted_nearby_pickup_points,
+    apply_rate_limit_async,
     fetch_wardrobe as vinted_fetch_wardrobe,
     fetch_ontology_categories as vinted_fetch_categories,
     fetch_ontology_brands as vinted_fetch_brands,
@@ -30,13 +33,14 @@ from vinted_client import (
     fetch_ontology_materials as vinted_fetch_materials,
     fetch_ontology_package_sizes as vinted_fetch_package_sizes,
     fetch_ontology_models as vinted_fetch_models,
+    fetch_ontology_bundle as vinted_fetch_ontology_bundle,
     fetch_item_detail as vinted_fetch_item_detail,
     upload_photo as vinted_upload_photo,
     create_listing as vinted_create_listing,
     edit_listing as vinted_edit_listing,
     delete_listing as vinted_delete_listing,
     hide_listing as vinted_hide_listing,
-    relist_item as vinted_relist_item,
+    relist_item_async as vinted_relist_item_async,
     fetch_sold_items as vinted_fetch_sold_items,
     fetch_bought_items as vinted_fetch_bought_items,
     fetch_conversation_detail as vinted_fetch_conversation_detail,
@@ -49,12 +53,21 @@ from vinted_client import (
     fetch_current_user as vinted_fetch_current_user,
     fetch_user_payment_cards as vinted_fetch_user_payment_cards,
     fetch_user_addresses as vinted_fetch_user_addresses,
+    shutdown_mutate_pool as vinted_shutdown_mutate_pool,
 )
-from image_mutator import mutate_image
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Stop the relist mutation worker processes along with the server
+    vinted_shutdown_mutate_pool()
+
 
 app = FastAPI(
     title="Vinted UK Sniper Bridge",
     version="0.3.0",
+    lifespan=lifespan,
 )
 
 # Allow Electron renderer and Chrome Extension content scripts to call this bridge.
@@ -87,10 +100,10 @@ def _error_response(code: str, message: str, status_code: int = 500) -> JSONResp
     )
 
 
-def _rate_limit_if_needed(base_interval: float, jitter: float) -> None:
-    """Apply delay when base_interval > 0."""
+async def _rate_limit_if_needed(base_interval: float, jitter: float) -> None:
+    """Apply delay when base_interval > 0, without blocking the event loop."""
     if base_interval > 0:
-        apply_rate_limit(base_interval, jitter)
+        await apply_rate_limit_async(base_interval, jitter)
 
 
 @app.get("/health")
@@ -100,7 +113,7 @@ def health():
 
 
 @app.get("/search")
-def search(
+async def search(
     url: str = Query(..., description="Vinted catalog URL (e.g. https://www.vinted.co.uk/catalog?search_text=...)"),
     page: int = Query(1, ge=1, le=100),
     proxy: Optional[str] = Query(None, description="Proxy URL (http:// or socks5://)"),
@@ -117,10 +130,10 @@ def search(
     if not x_vinted_cookie:
         return _error_response("MISSING_COOKIE", "X-Vinted-Cookie header required", 400)
 
-    _rate_limit_if_needed(base_interval, jitter)
+    await _rate_limit_if_needed(base_interval, jitter)
 
     try:
-        data = vinted_search(
+        data = await vinted_search(
             url=url,
             cookie=x_vinted_cookie,
             proxy=proxy,
@@ -134,6 +147,54 @@ def search(
         return _error_response(e.code, e.message, status)
 
 
+@app.post("/search/batch")
+async def search_batch(
+    body: dict = Body(...),
+    transport_mode: Optional[str] = Query(None, description="Transport mode: PROXY or DIRECT"),
+    base_interval: float = Query(0, ge=0, description="Base delay in seconds before the batch"),
+    jitter: float = Query(1, ge=0, description="Max random jitter in seconds"),
+    x_vinted_cookie: Optional[str] = Header(None, alias="X-Vinted-Cookie"),
+    x_vinted_user_agent: Optional[str] = Header(None, alias="X-Vinted-User-Agent"),
+):
+    """
+    Fetch several catalog search URLs in one call, concurrently.
+    Body: { "urls": ["https://www.vinted.co.uk/catalog?..."], "page": 1, "proxies": ["http://..."] }
+    Returns { ok: true, data: { <url>: { ok, data } | { ok: false, code, message } } };
+    one failing URL does not fail the batch.
+    """
+    if not x_vinted_cookie:
+        return _error_response("MISSING_COOKIE", "X-Vinted-Cookie header required", 400)
+
+    urls = body.get("urls")
+    if not isinstance(urls, list) or not urls or not all(isinstance(u, str) for u in urls):
+        return _error_response("INVALID_BODY", "urls required (list of catalog URLs)", 400)
+    try:
+        page = int(body.get("page", 1))
+    except (TypeError, ValueError):
+        return _error_response("INVALID_BODY", "page must be an integer", 400)
+    proxies = body.get("proxies")
+    if proxies is not None and (not isinstance(proxies, list) or not all(isinstance(p, str) for p in proxies)):
+        return _error_response("INVALID_BODY", "proxies must be a list of proxy URLs", 400)
+
+    await _rate_limit_if_needed(base_interval, jitter)
+
+    results = await vinted_search_many(
+        urls=urls,
+        cookie=x_vinted_cookie,
+        proxies=proxies or None,
+        page=page,
+        transport_mode=transport_mode,
+        user_agent=x_vinted_user_agent,
+    )
+    data = {}
+    for url, result in zip(urls, results):
+        if isinstance(result, VintedError):
+            data[url] = {"ok": False, "code": result.code, "message": result.message}
+        else:
+            data[url] = {"ok": True, "data": result}
+    return {"ok": True, "data": data}
+
+
 @app.get("/item/{item_id}/json")
 def get_item_json(
     item_id: int,
@@ -159,7 +220,7 @@ def get_item_json(
 
 
 @app.post("/checkout/build")
-def checkout_build(
+async def checkout_build(
     body: dict = Body(...),
     proxy: Optional[str] = Query(None),
     transport_mode: Optional[str] = Query(None),
@@ -185,10 +246,10 @@ def checkout_build(
     if not x_vinted_cookie:
         return _error_response("MISSING_COOKIE", "X-Vinted-Cookie header required", 400)
 
-    _rate_limit_if_needed(base_interval, jitter)
+    await _rate_limit_if_needed(base_interval, jitter)
 
     try:
-        data = vinted_checkout_build(
+        data = await vinted_checkout_build(
             order_id=order_id,
             cookie=x_vinted_cookie,
             csrf_token=x_csrf_token,
@@ -204,7 +265,7 @@ def checkout_build(
 
 
 @app.put("/checkout/{purchase_id}")
-def checkout_put(
+async def checkout_put(
     purchase_id: str,
     body: dict = Body(...),
     proxy: Optional[str] = Query(None),
@@ -224,10 +285,10 @@ def checkout_put(
     if not x_vinted_cookie:
         return _error_response("MISSING_COOKIE", "X-Vinted-Cookie header required", 400)
 
-    _rate_limit_if_needed(base_interval, jitter)
+    await _rate_limit_if_needed(base_interval, jitter)
 
     try:
-        data = vinted_checkout_put(
+        data = await vinted_checkout_put(
             purchase_id=purchase_id,
             components=components,
             cookie=x_vinted_cookie,
@@ -244,7 +305,7 @@ def checkout_put(
 
 
 @app.get("/checkout/nearby_pickup_points")
-def nearby_pickup_points(
+async def nearby_pickup_points(
     shipping_order_id: int = Query(...),
     latitude: float = Query(...),
     longitude: float = Query(...),
@@ -262,10 +323,10 @@ def nearby_pickup_points(
     if not x_vinted_cookie:
         return _error_response("MISSING_COOKIE", "X-Vinted-Cookie header required", 400)
 
-    _rate_limit_if_needed(base_interval, jitter)
+    await _rate_limit_if_needed(base_interval, jitter)
 
     try:
-        data = vinted_nearby_pickup_points(
+        data = await vinted_nearby_pickup_points(
             shipping_order_id=shipping_order_id,
             latitude=latitude,
             longitude=longitude,
@@ -457,8 +518,6 @@ def ontology_categories(
     proxy: Optional[str] = Query(None),
     transport_mode: Optional[str] = Query(None),
     x_vinted_cookie: Optional[str] = Header(None, alias="X-Vinted-Cookie"),
-    x_csrf_token: Optional[str] = Header(None, alias="X-Csrf-Token"),
-    x_anon_id: Optional[str] = Header(None, alias="X-Anon-Id"),
     x_vinted_user_agent: Optional[str] = Header(None, alias="X-Vinted-User-Agent"),
 ):
     """Fetch Vinted category tree."""
@@ -467,8 +526,31 @@ def ontology_categories(
     try:
         data = vinted_fetch_categories(
             cookie=x_vinted_cookie,
-            csrf_token=x_csrf_token,
-            anon_id=x_anon_id,
+            proxy=proxy,
+            transport_mode=transport_mode,
+            user_agent=x_vinted_user_agent,
+        )
+        return {"ok": True, "data": data}
+    except VintedError as e:
+        return _error_response(e.code, e.message, e.status_code or 500)
+
+
+@app.get("/ontology/bundle")
+async def ontology_bundle(
+    catalog_id: Optional[int] = Query(None),
+    proxy: Optional[str] = Query(None),
+    transport_mode: Optional[str] = Query(None),
+    x_vinted_cookie: Optional[str] = Header(None, alias="X-Vinted-Cookie"),
+    x_vinted_user_agent: Optional[str] = Header(None, alias="X-Vinted-User-Agent"),
+):
+    """Fetch categories, colors and brands (plus conditions when catalog_id is
+    given) concurrently in one call."""
+    if not x_vinted_cookie:
+        return _error_response("MISSING_COOKIE", "X-Vinted-Cookie header required", 400)
+    try:
+        data = await vinted_fetch_ontology_bundle(
+            cookie=x_vinted_cookie,
+            catalog_id=catalog_id,
             proxy=proxy,
             transport_mode=transport_mode,
             user_agent=x_vinted_user_agent,
@@ -485,8 +567,6 @@ def ontology_brands(
     proxy: Optional[str] = Query(None),
     transport_mode: Optional[str] = Query(None),
     x_vinted_cookie: Optional[str] = Header(None, alias="X-Vinted-Cookie"),
-    x_csrf_token: Optional[str] = Header(None, alias="X-Csrf-Token"),
-    x_anon_id: Optional[str] = Header(None, alias="X-Anon-Id"),
     x_vinted_user_agent: Optional[str] = Header(None, alias="X-Vinted-User-Agent"),
 ):
     """Fetch brands, optionally filtered by category or keyword."""
@@ -497,8 +577,6 @@ def ontology_brands(
             cookie=x_vinted_cookie,
             category_id=category_id,
             keyword=keyword,
-            csrf_token=x_csrf_token,
-            anon_id=x_anon_id,
             proxy=proxy,
             transport_mode=transport_mode,
             user_agent=x_vinted_user_agent,
@@ -513,8 +591,6 @@ def ontology_colors(
     proxy: Optional[str] = Query(None),
     transport_mode: Optional[str] = Query(None),
     x_vinted_cookie: Optional[str] = Header(None, alias="X-Vinted-Cookie"),
-    x_csrf_token: Optional[str] = Header(None, alias="X-Csrf-Token"),
-    x_anon_id: Optional[str] = Header(None, alias="X-Anon-Id"),
     x_vinted_user_agent: Optional[str] = Header(None, alias="X-Vinted-User-Agent"),
 ):
     """Fetch all color options."""
@@ -523,8 +599,6 @@ def ontology_colors(
     try:
         data = vinted_fetch_colors(
             cookie=x_vinted_cookie,
-            csrf_token=x_csrf_token,
-            anon_id=x_anon_id,
             proxy=proxy,
             transport_mode=transport_mode,
             user_agent=x_vinted_user_agent,
@@ -540,8 +614,6 @@ def ontology_conditions(
     proxy: Optional[str] = Query(None),
     transport_mode: Optional[str] = Query(None),
     x_vinted_cookie: Optional[str] = Header(None, alias="X-Vinted-Cookie"),
-    x_csrf_token: Optional[str] = Header(None, alias="X-Csrf-Token"),
-    x_anon_id: Optional[str] = Header(None, alias="X-Anon-Id"),
     x_vinted_user_agent: Optional[str] = Header(None, alias="X-Vinted-User-Agent"),
 ):
     """Fetch conditions for a category."""
@@ -551,8 +623,6 @@ def ontology_conditions(
         data = vinted_fetch_conditions(
             cookie=x_vinted_cookie,
             catalog_id=catalog_id,
-            csrf_token=x_csrf_token,
-            anon_id=x_anon_id,
             proxy=proxy,
             transport_mode=transport_mode,
             user_agent=x_vinted_user_agent,
@@ -568,8 +638,6 @@ def ontology_sizes(
     proxy: Optional[str] = Query(None),
     transport_mode: Optional[str] = Query(None),
     x_vinted_cookie: Optional[str] = Header(None, alias="X-Vinted-Cookie"),
-    x_csrf_token: Optional[str] = Header(None, alias="X-Csrf-Token"),
-    x_anon_id: Optional[str] = Header(None, alias="X-Anon-Id"),
     x_vinted_user_agent: Optional[str] = Header(None, alias="X-Vinted-User-Agent"),
 ):
     """Fetch sizes for a category. Uses local cache from extension if available."""
@@ -593,8 +661,6 @@ def ontology_sizes(
         data = vinted_fetch_sizes(
             cookie=x_vinted_cookie,
             catalog_id=catalog_id,
-            csrf_token=x_csrf_token,
-            anon_id=x_anon_id,
             proxy=proxy,
             transport_mode=transport_mode,
             user_agent=x_vinted_user_agent,
@@ -725,8 +791,6 @@ def ontology_package_sizes(
     proxy: Optional[str] = Query(None),
     transport_mode: Optional[str] = Query(None),
     x_vinted_cookie: Optional[str] = Header(None, alias="X-Vinted-Cookie"),
-    x_csrf_token: Optional[str] = Header(None, alias="X-Csrf-Token"),
-    x_anon_id: Optional[str] = Header(None, alias="X-Anon-Id"),
     x_vinted_user_agent: Optional[str] = Header(None, alias="X-Vinted-User-Agent"),
 ):
     """Fetch package sizes for a category."""
@@ -737,8 +801,6 @@ def ontology_package_sizes(
             cookie=x_vinted_cookie,
             catalog_id=catalog_id,
             item_id=item_id,
-            csrf_token=x_csrf_token,
-            anon_id=x_anon_id,
             proxy=proxy,
             transport_mode=transport_mode,
             user_agent=x_vinted_user_agent,
@@ -755,8 +817,6 @@ def ontology_models(
     proxy: Optional[str] = Query(None),
     transport_mode: Optional[str] = Query(None),
     x_vinted_cookie: Optional[str] = Header(None, alias="X-Vinted-Cookie"),
-    x_csrf_token: Optional[str] = Header(None, alias="X-Csrf-Token"),
-    x_anon_id: Optional[str] = Header(None, alias="X-Anon-Id"),
     x_vinted_user_agent: Optional[str] = Header(None, alias="X-Vinted-User-Agent"),
 ):
     """Fetch models for a luxury brand + category combination."""
@@ -767,8 +827,6 @@ def ontology_models(
             cookie=x_vinted_cookie,
             catalog_id=catalog_id,
             brand_id=brand_id,
-            csrf_token=x_csrf_token,
-            anon_id=x_anon_id,
             proxy=proxy,
             transport_mode=transport_mode,
             user_agent=x_vinted_user_agent,
@@ -825,6 +883,9 @@ async def upload_photo(
     if not x_vinted_cookie:
         return _error_response("MISSING_COOKIE", "X-Vinted-Cookie header required", 400)
 
+    # Deferred: image_mutator pulls in Pillow/NumPy, which would slow bridge startup
+    from image_mutator import mutate_image
+
     try:
         raw_bytes = await file.read()
         mutated_bytes = mutate_image(raw_bytes, relist_count)
@@ -905,6 +966,8 @@ async def preview_mutation(
     Returns the mutated image bytes directly (JPEG).
     Used for generating preview thumbnails in the Waiting Room.
     """
+    from image_mutator import mutate_image
+
     try:
         raw_bytes = await file.read()
         mutated_bytes = mutate_image(raw_bytes, relist_count)
@@ -1092,7 +1155,7 @@ async def relist(
         return _error_response("INVALID_BODY", "image_bytes_b64 required (list of base64 image strings)", 400)
 
     try:
-        result = vinted_relist_item(
+        result = await vinted_relist_item_async(
             cookie=x_vinted_cookie,
             old_item_id=int(old_item_id),
             item_data=item_data,
@@ -1147,7 +1210,10 @@ async def relist_v2(
         return _error_response("INVALID_BODY", "photo_urls required (list of CDN URLs)", 400)
 
     try:
-        result = vinted_orchestrate_relist(
+        # Blocking (downloads, uploads, 8-15s post-delete wait): run it off the
+        # event loop so other bridge requests keep being served meanwhile
+        result = await asyncio.to_thread(
+            vinted_orchestrate_relist,
             cookie=x_vinted_cookie,
             old_item_id=int(old_item_id),
             item_data=item_data,
@@ -1953,7 +2019,7 @@ def create_buy_conv(
 
 
 @app.post("/checkout/pay")
-def checkout_pay_endpoint(
+async def checkout_pay_endpoint(
     body: dict = Body(...),
     proxy: Optional[str] = Query(None),
     transport_mode: Optional[str] = Query(None),
@@ -1970,7 +2036,7 @@ def checkout_pay_endpoint(
     if not purchase_id or not checksum:
         return _error_response("MISSING_PARAMS", "purchase_id and checksum required", 400)
     try:
-        data = vinted_checkout_pay(
+        data = await vinted_checkout_pay(
             purchase_id=str(purchase_id),
             checksum=str(checksum),
             cookie=x_vinted_cookie,
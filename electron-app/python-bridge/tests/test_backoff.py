@@ -0,0 +1,95 @@
+"""
+Unit tests for the HTTP 429 retry helpers.
+
+Run from python-bridge/:
+  python -m pytest tests
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import vinted_client
+from vinted_client import _request_with_backoff
+
+
+def _resp(status_code, retry_after=None):
+    headers = {"Retry-After": str(retry_after)} if retry_after is not None else {}
+    return mock.Mock(status_code=status_code, headers=headers)
+
+
+class SyncBackoffTest(unittest.TestCase):
+    def setUp(self):
+        self.sleeps = []
+        for patcher in (
+            mock.patch.object(vinted_client.time, "sleep", side_effect=self.sleeps.append),
+            mock.patch.object(vinted_client.random, "uniform", return_value=1.0),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_sleep_budget_bounds_the_retries(self):
+        send = mock.Mock(return_value=_resp(429))
+        resp = _request_with_backoff(send, url="u")
+
+        self.assertEqual(resp.status_code, 429)
+        # 1s + 2s + 4s fit the budget; the 8s wait would not
+        self.assertEqual(self.sleeps, [1.0, 2.0, 4.0])
+        self.assertEqual(send.call_count, 4)
+
+    def test_long_retry_after_is_returned_not_slept(self):
+        send = mock.Mock(return_value=_resp(429, retry_after=30))
+        resp = _request_with_backoff(send, url="u")
+
+        self.assertEqual(resp.headers["Retry-After"], "30")
+        self.assertEqual(self.sleeps, [])
+        send.assert_called_once_with(url="u")
+
+    def test_success_after_retry(self):
+        send = mock.Mock(side_effect=[_resp(429, retry_after=1), _resp(200)])
+        self.assertEqual(_request_with_backoff(send).status_code, 200)
+        self.assertEqual(self.sleeps, [1.0])
+
+
+class UploadRetryTest(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(vinted_client, "_handle_response", side_effect=lambda resp, **kw: {"id": 1})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_sync_retry_sends_a_fresh_multipart(self):
+        parts = []
+
+        def post(**kwargs):
+            parts.append(kwargs["multipart"])
+            return _resp(429, retry_after=0) if len(parts) == 1 else _resp(200)
+
+        session = mock.Mock()
+        session.post.side_effect = post
+        with mock.patch.object(vinted_client.time, "sleep"):
+            vinted_client.upload_photo("c=1", b"jpeg", session=session)
+
+        self.assertEqual(len(parts), 2)
+        self.assertIsNot(parts[0], parts[1])
+
+    def test_async_retry_sends_a_fresh_multipart(self):
+        parts = []
+
+        async def post(**kwargs):
+            parts.append(kwargs["multipart"])
+            return _resp(429, retry_after=0) if len(parts) == 1 else _resp(200)
+
+        session = mock.Mock()
+        session.post.side_effect = post
+        asyncio.run(vinted_client.upload_photo_async("c=1", b"jpeg", session=session))
+
+        self.assertEqual(len(parts), 2)
+        self.assertIsNot(parts[0], parts[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
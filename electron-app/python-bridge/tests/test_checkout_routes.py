@@ -0,0 +1,82 @@
+"""
+Tests for the checkout routes' use of the async client.
+
+Run from python-bridge/:
+  python -m pytest tests
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+
+import server
+import vinted_client
+from vinted_client import VintedError
+
+_HEADERS = {"X-Vinted-Cookie": "c=1", "X-Csrf-Token": "t", "X-Vinted-User-Agent": "UA"}
+
+
+class CheckoutRoutesTest(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(server.app)
+        self.calls = []
+
+    def _fake(self, name, result=None, error=None):
+        async def fake(**kwargs):
+            self.calls.append((name, kwargs))
+            if error is not None:
+                raise error
+            return result if result is not None else {"name": name}
+
+        patcher = mock.patch.object(server, name, fake)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_checkout_flow_awaits_async_client(self):
+        for name in ("vinted_checkout_build", "vinted_checkout_put", "vinted_nearby_pickup_points", "vinted_checkout_pay"):
+            self._fake(name)
+        qs = "proxy=http://p1&transport_mode=PROXY"
+
+        self.assertEqual(self.client.post(f"/checkout/build?{qs}", json={"order_id": "7"}, headers=_HEADERS).json(),
+                         {"ok": True, "data": {"name": "vinted_checkout_build"}})
+        self.assertTrue(self.client.put(f"/checkout/p1?{qs}", json={"components": {"a": 1}}, headers=_HEADERS).json()["ok"])
+        self.assertTrue(self.client.get(
+            f"/checkout/nearby_pickup_points?{qs}&shipping_order_id=3&latitude=51.5&longitude=-0.1",
+            headers=_HEADERS,
+        ).json()["ok"])
+        self.assertTrue(self.client.post(f"/checkout/pay?{qs}", json={"purchase_id": "p1", "checksum": "x"}, headers=_HEADERS).json()["ok"])
+
+        self.assertEqual([name for name, _ in self.calls], [
+            "vinted_checkout_build", "vinted_checkout_put", "vinted_nearby_pickup_points", "vinted_checkout_pay",
+        ])
+        for _, kwargs in self.calls:
+            self.assertEqual((kwargs["proxy"], kwargs["transport_mode"]), ("http://p1", "PROXY"))
+        self.assertEqual(self.calls[0][1]["order_id"], 7)
+        self.assertEqual(self.calls[1][1]["components"], {"a": 1})
+
+    def test_client_error_mapped(self):
+        self._fake("vinted_checkout_build", error=VintedError("FORBIDDEN", "no", 403))
+        resp = self.client.post("/checkout/build", json={"order_id": 7}, headers=_HEADERS)
+        self.assertEqual(resp.status_code, 403)
+        self.assertEqual(resp.json(), {"ok": False, "code": "FORBIDDEN", "message": "no"})
+
+    def test_pickup_points_served_from_cache_without_a_session(self):
+        vinted_client._pickup_cache.clear()
+        self.addCleanup(vinted_client._pickup_cache.clear)
+        points = {"nearby_pickup_points": [{"id": 1}]}
+        vinted_client._pickup_cache_put(vinted_client._pickup_cache_key(3, 51.5, -0.1, "GB"), points)
+        with mock.patch.object(vinted_client, "_get_async_session", side_effect=AssertionError("network")):
+            resp = self.client.get(
+                "/checkout/nearby_pickup_points?shipping_order_id=3&latitude=51.5&longitude=-0.1",
+                headers=_HEADERS,
+            )
+        self.assertEqual(resp.json(), {"ok": True, "data": points})
+
+
+if __name__ == "__main__":
+    unittest.main()
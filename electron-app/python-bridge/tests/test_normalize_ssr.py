@@ -0,0 +1,210 @@
+"""
+Unit tests for _normalize_ssr_item.
+
+Run from python-bridge/:
+  python -m pytest tests
+  python -m unittest discover tests
+"""
+
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vinted_client import _normalize_ssr_item
+
+
+def _reference_normalize(raw: dict) -> dict:
+    """_normalize_ssr_item as it was before the single-pass rewrite (frozen copy)."""
+    out: dict = {}
+
+    # ── Pass-through simple scalar fields ────────────────────────────────
+    for key in (
+        "id", "title", "description", "is_unisex", "isbn",
+        "measurement_length", "measurement_width",
+        "manufacturer", "manufacturer_labelling",
+        "video_game_rating_id", "model_metadata",
+    ):
+        if key in raw and raw[key] is not None:
+            out[key] = raw[key]
+
+    # ── Price — number, string, or {amount, currency_code} ───────────────
+    price_raw = raw.get("price")
+    if isinstance(price_raw, dict):
+        out["price"] = price_raw.get("amount", price_raw.get("price"))
+        out["currency"] = price_raw.get("currency_code", "GBP")
+    elif price_raw is not None:
+        out["price"] = price_raw
+
+    # ── catalog_id (category) ────────────────────────────────────────────
+    out["catalog_id"] = (
+        raw.get("catalog_id")
+        or raw.get("category_id")
+        or raw.get("catalogId")
+        or raw.get("categoryId")
+    )
+    for nested_key in ("category", "catalog", "catalogue"):
+        obj = raw.get(nested_key)
+        if isinstance(obj, dict) and not out.get("catalog_id"):
+            out["catalog_id"] = obj.get("id")
+
+    # ── brand_id / brand_title ───────────────────────────────────────────
+    out["brand_id"] = raw.get("brand_id") or raw.get("brandId")
+    brand_title = None
+    for bkey in ("brand_dto", "brand"):
+        bval = raw.get(bkey)
+        if isinstance(bval, dict):
+            if not out.get("brand_id"):
+                out["brand_id"] = bval.get("id")
+            brand_title = bval.get("title") or bval.get("name") or brand_title
+        elif isinstance(bval, str) and bval:
+            brand_title = bval
+    out["brand_title"] = brand_title or raw.get("brand_title") or raw.get("brandTitle")
+
+    # ── size_id ──────────────────────────────────────────────────────────
+    out["size_id"] = raw.get("size_id") or raw.get("sizeId")
+    size_val = raw.get("size")
+    if isinstance(size_val, dict) and not out.get("size_id"):
+        out["size_id"] = size_val.get("id")
+    out["size_title"] = (
+        raw.get("size_title")
+        or (size_val.get("title") if isinstance(size_val, dict) else None)
+        or (size_val if isinstance(size_val, str) else None)
+    )
+
+    # ── status_id (condition) ────────────────────────────────────────────
+    out["status_id"] = raw.get("status_id") or raw.get("statusId")
+    status_val = raw.get("status")
+    if isinstance(status_val, dict) and not out.get("status_id"):
+        out["status_id"] = status_val.get("id")
+    elif isinstance(status_val, str) and not out.get("status_id"):
+        _cond_map = {
+            "New with tags": 6, "new_with_tags": 6,
+            "New without tags": 1, "new_without_tags": 1,
+            "Very good": 2, "very_good": 2,
+            "Good": 3, "good": 3,
+            "Satisfactory": 4, "satisfactory": 4,
+            "Not fully functional": 5,
+        }
+        out["status_id"] = _cond_map.get(status_val)
+
+    # ── package_size_id ──────────────────────────────────────────────────
+    out["package_size_id"] = raw.get("package_size_id") or raw.get("packageSizeId")
+    pkg_val = raw.get("package_size")
+    if isinstance(pkg_val, dict) and not out.get("package_size_id"):
+        out["package_size_id"] = pkg_val.get("id")
+
+    # ── color_ids ────────────────────────────────────────────────────────
+    cids = raw.get("color_ids") or raw.get("colorIds")
+    if isinstance(cids, list):
+        out["color_ids"] = cids
+    else:
+        colors_arr = raw.get("colors")
+        if isinstance(colors_arr, list):
+            out["color_ids"] = [
+                c.get("id") if isinstance(c, dict) else c
+                for c in colors_arr
+                if (c.get("id") if isinstance(c, dict) else c) is not None
+            ]
+        else:
+            ids = []
+            c1 = raw.get("color1_id") or raw.get("color1Id")
+            c2 = raw.get("color2_id") or raw.get("color2Id")
+            if c1:
+                ids.append(c1)
+            if c2:
+                ids.append(c2)
+            if ids:
+                out["color_ids"] = ids
+
+    # ── item_attributes (materials, etc.) ────────────────────────────────
+    attrs = raw.get("item_attributes") or raw.get("itemAttributes") or raw.get("attributes")
+    if attrs is not None:
+        out["item_attributes"] = attrs
+
+    # ── shipment_prices ──────────────────────────────────────────────────
+    sp = raw.get("shipment_prices") or raw.get("shipmentPrices")
+    if sp is not None:
+        out["shipment_prices"] = sp
+
+    # ── is_hidden / is_closed / is_reserved / is_draft flags ─────────────
+    for flag in ("is_hidden", "is_closed", "is_reserved", "is_draft"):
+        if flag in raw:
+            out[flag] = raw[flag]
+
+    # ── photos (preserve for downstream) ─────────────────────────────────
+    photos = raw.get("photos")
+    if isinstance(photos, list):
+        out["photos"] = photos
+
+    # Strip None values to keep the output clean
+    return {k: v for k, v in out.items() if v is not None}
+
+
+_NESTED_KEYS = ("category", "catalog", "catalogue", "brand_dto", "brand", "size", "status", "package_size")
+_LIST_KEYS = ("photos", "item_attributes", "itemAttributes", "attributes", "shipment_prices", "shipmentPrices")
+_KEYS = (
+    "id", "title", "description", "is_unisex", "price",
+    "catalog_id", "category_id", "catalogId", "categoryId",
+    "brand_id", "brandId", "brand_title", "brandTitle",
+    "size_id", "sizeId", "size_title", "status_id", "statusId",
+    "package_size_id", "packageSizeId",
+    "color_ids", "colorIds", "colors", "color1_id", "color1Id", "color2_id", "color2Id",
+    "is_hidden", "is_draft", "currency", "user",
+) + _NESTED_KEYS + _LIST_KEYS
+_FALSY = (None, 0, "", [], {}, False)
+
+
+def _random_value(rng: random.Random, key: str) -> object:
+    if rng.random() < 0.35:
+        return rng.choice(_FALSY)
+    if key == "price":
+        return rng.choice([{"amount": "10.0", "currency_code": "EUR"}, {"price": "3"}, "12.50", {}])
+    if key in _NESTED_KEYS:
+        return rng.choice([
+            {"id": rng.choice([0, None, 5])},
+            {"id": 3, "title": rng.choice(["", "T", None]), "name": rng.choice(["", "N", None])},
+            {}, "Good", "Very good", "xx", "",
+        ])
+    if key == "colors":
+        return rng.choice([[{"id": 1}, {"id": None}, 2, None], [3, 4], "bad", []])
+    if key in ("color_ids", "colorIds"):
+        return rng.choice([[1, 2], "bad", []])
+    if key in _LIST_KEYS:
+        return rng.choice([[{"a": 1}], {"x": 1}, []])
+    return rng.choice([rng.randint(1, 99), "str", True])
+
+
+class NormalizeSsrItemTest(unittest.TestCase):
+    def test_matches_reference_on_random_items(self):
+        rng = random.Random(1234)
+        for _ in range(20000):
+            raw = {k: _random_value(rng, k) for k in rng.sample(_KEYS, rng.randint(0, len(_KEYS)))}
+            self.assertEqual(_normalize_ssr_item(dict(raw)), _reference_normalize(dict(raw)), raw)
+
+    def test_falsy_aliases_fall_through_like_or_chain(self):
+        self.assertEqual(_normalize_ssr_item({"brand_id": 0, "brandId": 7}), {"brand_id": 7})
+        # Only the last spelling of a chain can surface a falsy value
+        self.assertEqual(_normalize_ssr_item({"brand_id": 0}), {})
+        self.assertEqual(_normalize_ssr_item({"brandId": 0}), {"brand_id": 0})
+        self.assertEqual(_normalize_ssr_item({"item_attributes": [], "attributes": [1]}), {"item_attributes": [1]})
+        self.assertEqual(_normalize_ssr_item({"size_title": "", "size": {"title": "M"}}), {"size_title": "M"})
+
+    def test_api_shaped_item_is_still_normalized(self):
+        raw = {
+            "id": 1, "title": "Shirt", "catalog_id": 5, "brand_title": "Nike",
+            "price": {"amount": "12.0", "currency_code": "GBP"},
+            "brand": {"id": 53, "title": "Nike"}, "status": "Good",
+            "color1_id": 2, "user": {"id": 9},
+        }
+        self.assertEqual(_normalize_ssr_item(raw), {
+            "id": 1, "title": "Shirt", "catalog_id": 5, "brand_title": "Nike",
+            "price": "12.0", "currency": "GBP", "brand_id": 53, "status_id": 3,
+            "color_ids": [2],
+        })
+
+
+if __name__ == "__main__":
+    unittest.main()
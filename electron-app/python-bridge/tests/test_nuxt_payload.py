@@ -0,0 +1,57 @@
+"""
+Unit tests for Nuxt __NUXT_DATA__ payload resolution.
+
+Run from python-bridge/:
+  python -m pytest tests
+"""
+
+import json
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vinted_client import _parse_item_from_html, _parse_nuxt_payload
+
+
+def _page(payload: list) -> str:
+    return f'<html><script type="application/json" id="__NUXT_DATA__">{json.dumps(payload)}</script></html>'
+
+
+class NuxtPayloadTest(unittest.TestCase):
+    def test_shared_node_resolves_once_per_reference(self):
+        # Both items point at the same brand object (index 4)
+        payload = [["Reactive", 1], [2, 3], {"brand": 4}, {"brand": 4}, {"title": 5}, "Nike"]
+        data = _parse_nuxt_payload(json.dumps(payload))
+        self.assertEqual(data, [{"brand": {"title": "Nike"}}, {"brand": {"title": "Nike"}}])
+
+    def test_cyclic_payload_resolves_to_serialisable_item(self):
+        # item.user.items[0] -> item, and a Ref that points at itself
+        payload = [
+            ["ShallowReactive", 1],
+            {"item": 2},
+            {"id": 3, "title": 4, "user": 5, "loop": 8},
+            123,
+            "Shirt",
+            {"login": 6, "items": 7},
+            "seller",
+            [2],
+            ["Ref", 8],
+        ]
+        item = _parse_item_from_html(_page(payload), 123)
+        self.assertEqual(item["title"], "Shirt")
+        self.assertEqual(item["user"], {"login": "seller", "items": [None]})
+        self.assertIsNone(item["loop"])
+        # Must not raise "Circular reference detected"
+        json.dumps(item, default=str)
+
+    def test_self_referencing_root(self):
+        payload = [["Reactive", 1], {"self": 1, "name": 2}, "x"]
+        data = _parse_nuxt_payload(json.dumps(payload))
+        self.assertEqual(data, {"self": None, "name": "x"})
+        json.dumps(data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+"""
+Unit tests for the nearby-pickup-points TTL cache.
+
+Run from python-bridge/:
+  python -m pytest tests
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import vinted_client
+from vinted_client import _pickup_cache_get, _pickup_cache_key, _pickup_cache_put
+
+_POINTS = {"nearby_pickup_points": [{"id": 1, "name": "Shop"}]}
+
+
+class PickupCacheTest(unittest.TestCase):
+    def setUp(self):
+        vinted_client._pickup_cache.clear()
+        self.addCleanup(vinted_client._pickup_cache.clear)
+
+    def test_hit_returns_independent_copy(self):
+        key = _pickup_cache_key(1, 51.5, -0.12, "GB")
+        _pickup_cache_put(key, _POINTS)
+        first = _pickup_cache_get(key)
+        self.assertEqual(first, _POINTS)
+        first["nearby_pickup_points"].clear()
+        self.assertEqual(_pickup_cache_get(key), _POINTS)
+
+    def test_entry_expires_after_ttl(self):
+        key = _pickup_cache_key(1, 51.5, -0.12, "GB")
+        with mock.patch.object(vinted_client.time, "monotonic", return_value=1000.0):
+            _pickup_cache_put(key, _POINTS)
+        ttl = vinted_client._PICKUP_CACHE_TTL
+        with mock.patch.object(vinted_client.time, "monotonic", return_value=1000.0 + ttl - 1):
+            self.assertEqual(_pickup_cache_get(key), _POINTS)
+        with mock.patch.object(vinted_client.time, "monotonic", return_value=1000.0 + ttl + 1):
+            self.assertIsNone(_pickup_cache_get(key))
+        self.assertNotIn(key, vinted_client._pickup_cache)
+
+    def test_key_rounds_coordinates_and_separates_orders(self):
+        self.assertEqual(
+            _pickup_cache_key(1, 51.500001, -0.120001, "GB"),
+            _pickup_cache_key(1, 51.5, -0.12, "GB"),
+        )
+        self.assertNotEqual(_pickup_cache_key(1, 51.5, -0.12, "GB"), _pickup_cache_key(2, 51.5, -0.12, "GB"))
+        self.assertNotEqual(_pickup_cache_key(1, 51.5, -0.12, "GB"), _pickup_cache_key(1, 51.5001, -0.12, "GB"))
+        self.assertNotEqual(_pickup_cache_key(1, 51.5, -0.12, "GB"), _pickup_cache_key(1, 51.5, -0.12, "FR"))
+
+        _pickup_cache_put(_pickup_cache_key(1, 51.5, -0.12, "GB"), _POINTS)
+        self.assertIsNone(_pickup_cache_get(_pickup_cache_key(2, 51.5, -0.12, "GB")))
+
+    def test_size_is_bounded_lru(self):
+        with mock.patch.object(vinted_client, "_PICKUP_CACHE_MAX", 2):
+            _pickup_cache_put(("a",), {"n": 1})
+            _pickup_cache_put(("b",), {"n": 2})
+            _pickup_cache_get(("a",))  # refresh a, so b is oldest
+            _pickup_cache_put(("c",), {"n": 3})
+        self.assertEqual(list(vinted_client._pickup_cache), [("a",), ("c",)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,206 @@
+"""
+Unit tests for the relist photo upload stage.
+
+Run from python-bridge/:
+  python -m pytest tests
+"""
+
+import asyncio
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import vinted_client
+from vinted_client import VintedError, relist_item, relist_item_async
+
+
+class RelistTestCase(unittest.TestCase):
+    def setUp(self):
+        # Worker processes can't see mocks; mutate in threads instead
+        executor = ThreadPoolExecutor(max_workers=2)
+        self.addCleanup(executor.shutdown)
+        self.real_sleep = real_sleep = asyncio.sleep
+
+        async def no_wait(delay, *args, **kwargs):
+            await real_sleep(0)
+
+        patches = [
+            mock.patch("image_mutator.mutate_image", side_effect=lambda b, n: b),
+            mock.patch("image_mutator.jitter_text", side_effect=lambda text, n: text),
+            mock.patch.object(vinted_client, "_get_mutate_pool", return_value=executor),
+            mock.patch.object(vinted_client, "_ASYNC_CLOSE_GRACE", 0),
+            mock.patch.object(vinted_client.random, "uniform", return_value=0.0),
+            mock.patch.object(vinted_client.asyncio, "sleep", no_wait),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def _patch_steps(self, upload=None, create=None):
+        """Fake the upload/delete/create calls, recording the session each one used."""
+        self.sessions = []
+
+        async def default_upload(**kwargs):
+            return {"id": int(kwargs["image_bytes"])}
+
+        async def delete(**kwargs):
+            self.sessions.append(kwargs["session"])
+            return {}
+
+        async def default_create(**kwargs):
+            return {"id": 99, "photos": kwargs["item_data"]["assigned_photos"]}
+
+        def recording(fn):
+            async def wrapper(**kwargs):
+                self.sessions.append(kwargs["session"])
+                return await fn(**kwargs)
+            return wrapper
+
+        for name, fake in (
+            ("upload_photo_async", recording(upload or default_upload)),
+            ("delete_listing_async", delete),
+            ("create_listing_async", recording(create or default_create)),
+        ):
+            patcher = mock.patch.object(vinted_client, name, side_effect=fake)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+
+class RelistSyncWrapperTest(RelistTestCase):
+    def test_first_upload_failure_abandons_the_rest(self):
+        calls = []
+
+        async def upload(**kwargs):
+            calls.append(kwargs["image_bytes"])
+            if kwargs["image_bytes"] == b"0":
+                raise VintedError("HTTP_ERROR", "boom", 500)
+            await self.real_sleep(0.05)
+            return {"id": 1}
+
+        self._patch_steps(upload=upload)
+        images = [str(i).encode() for i in range(20)]
+        with self.assertRaises(VintedError) as ctx:
+            relist_item("c=1", 1, {}, images, relist_count=1)
+
+        self.assertEqual(ctx.exception.message, "boom")
+        # Only the uploads already in flight when photo 0 failed may have run
+        self.assertLessEqual(len(calls), vinted_client._RELIST_UPLOAD_WORKERS)
+        vinted_client.create_listing_async.assert_not_called()
+
+    def test_uploads_keep_source_order_and_session_is_closed(self):
+        self._patch_steps()
+        images = [str(i).encode() for i in range(1, 8)]
+        result = relist_item("c=1", 1, {}, images, relist_count=1)
+
+        self.assertEqual(result["photo_ids"], list(range(1, 8)))
+        self.assertTrue(self.sessions[0]._closed)
+
+
+class RelistAsyncTest(RelistTestCase):
+    def test_one_pooled_session_for_upload_delete_and_create(self):
+        self._patch_steps()
+        images = [str(i).encode() for i in range(1, 6)]
+
+        async def main():
+            first = await relist_item_async(
+                "c=1", 1, {"title": "t"}, images, relist_count=1,
+                proxy="http://p1", transport_mode="PROXY",
+            )
+            second = await relist_item_async(
+                "c=1", 2, {"title": "t"}, images, relist_count=2,
+                proxy="http://p1", transport_mode="PROXY",
+            )
+            session = self.sessions[0]
+            self.assertFalse(session._closed)
+            await session.close()
+            return first, second
+
+        first, second = asyncio.run(main())
+
+        self.assertEqual(first["photo_ids"], [1, 2, 3, 4, 5])
+        self.assertTrue(first["delete_succeeded"])
+        self.assertTrue(second["delete_succeeded"])
+        # Both relists: five uploads, a delete and a create each
+        self.assertEqual(len(self.sessions), 14)
+        session = self.sessions[0]
+        self.assertTrue(all(s is session for s in self.sessions))
+        self.assertEqual(session.http_version, vinted_client._HTTP_VERSION)
+        self.assertEqual(session.curl_options, vinted_client._CURL_OPTIONS)
+        self.assertEqual(session.proxies, {"all": "http://p1"})
+
+    def test_403_discards_pooled_session(self):
+        async def create(**kwargs):
+            raise VintedError("FORBIDDEN", "datadome", 403)
+
+        self._patch_steps(create=create)
+
+        async def main():
+            with self.assertRaises(VintedError):
+                await relist_item_async("c=1", 1, {}, [b"1"], relist_count=1, proxy="http://p1", transport_mode="PROXY")
+            burned = self.sessions[0]
+            for _ in range(10):
+                if burned._closed:
+                    break
+                await self.real_sleep(0.01)
+            self.assertTrue(burned._closed)
+            fresh = vinted_client._get_relist_session("http://p1", "PROXY", vinted_client._current_impostor())
+            self.assertIsNot(fresh, burned)
+            await fresh.close()
+
+        asyncio.run(main())
+
+    def test_failed_relist_leaves_no_pending_tasks(self):
+        async def upload(**kwargs):
+            if kwargs["image_bytes"] == b"0":
+                raise VintedError("HTTP_ERROR", "boom", 500)
+            await self.real_sleep(0.05)
+            return {"id": 1}
+
+        self._patch_steps(upload=upload)
+
+        async def main():
+            with self.assertRaises(VintedError):
+                await relist_item_async("c=1", 1, {}, [str(i).encode() for i in range(20)], relist_count=1)
+            self.assertEqual(asyncio.all_tasks(), {asyncio.current_task()})
+            await self.sessions[0].close()
+
+        asyncio.run(main())
+
+    def test_mutations_submitted_at_most_a_queue_ahead(self):
+        real_sleep = self.real_sleep
+        mutated = []
+
+        def mutate(b, n):
+            mutated.append(b)
+            return b
+
+        async def stalled_upload(**kwargs):
+            await real_sleep(0.2)
+            raise VintedError("HTTP_ERROR", "boom", 500)
+
+        self._patch_steps(upload=stalled_upload)
+        images = [str(i).encode() for i in range(50)]
+        with mock.patch("image_mutator.mutate_image", side_effect=mutate):
+            with self.assertRaises(VintedError):
+                relist_item("c=1", 1, {}, images, relist_count=1)
+
+        # Queue slots, the submission window and one photo per uploader
+        window = vinted_client._RELIST_UPLOAD_WORKERS * 2
+        self.assertLessEqual(len(mutated), 2 * window + vinted_client._RELIST_UPLOAD_WORKERS + 1)
+
+
+class MutatePoolTest(unittest.TestCase):
+    def test_shutdown_mutate_pool(self):
+        pool = vinted_client._get_mutate_pool()
+        vinted_client.shutdown_mutate_pool()
+        self.assertIsNone(vinted_client._mutate_pool)
+        self.assertIsNot(vinted_client._get_mutate_pool(), pool)
+        vinted_client.shutdown_mutate_pool()
+
+
+if __name__ == "__main__":
+    unittest.main()
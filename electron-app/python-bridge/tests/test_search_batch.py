@@ -0,0 +1,95 @@
+"""
+Tests for the POST /search/batch route.
+
+Run from python-bridge/:
+  python -m pytest tests
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+
+import server
+from vinted_client import VintedError
+
+_URL_A = "https://www.vinted.co.uk/catalog?search_text=a"
+_URL_B = "https://www.vinted.co.uk/catalog?search_text=b"
+
+
+class SearchBatchRouteTest(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(server.app)
+        self.calls = []
+
+        async def fake_search_many(**kwargs):
+            self.calls.append(kwargs)
+            return [
+                {"items": [{"id": 1}]} if url == _URL_A else VintedError("RATE_LIMITED", "slow down", 429)
+                for url in kwargs["urls"]
+            ]
+
+        patcher = mock.patch.object(server, "vinted_search_many", fake_search_many)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_results_keyed_by_url_and_failures_isolated(self):
+        resp = self.client.post(
+            "/search/batch?transport_mode=PROXY",
+            json={"urls": [_URL_A, _URL_B], "page": "2", "proxies": ["http://p1"]},
+            headers={"X-Vinted-Cookie": "c=1", "X-Vinted-User-Agent": "UA"},
+        )
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json(), {
+            "ok": True,
+            "data": {
+                _URL_A: {"ok": True, "data": {"items": [{"id": 1}]}},
+                _URL_B: {"ok": False, "code": "RATE_LIMITED", "message": "slow down"},
+            },
+        })
+        self.assertEqual(self.calls, [{
+            "urls": [_URL_A, _URL_B],
+            "cookie": "c=1",
+            "proxies": ["http://p1"],
+            "page": 2,
+            "transport_mode": "PROXY",
+            "user_agent": "UA",
+        }])
+
+    def test_rate_limit_awaited_before_search(self):
+        order = []
+
+        async def fake_rate_limit(base, jitter):
+            order.append(("wait", base, jitter))
+
+        with mock.patch.object(server, "apply_rate_limit_async", fake_rate_limit):
+            resp = self.client.post(
+                "/search/batch?base_interval=2&jitter=0.5",
+                json={"urls": [_URL_A]},
+                headers={"X-Vinted-Cookie": "c=1"},
+            )
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(order, [("wait", 2.0, 0.5)])
+        self.assertEqual(len(self.calls), 1)
+
+    def test_missing_cookie(self):
+        resp = self.client.post("/search/batch", json={"urls": [_URL_A]})
+        self.assertEqual(resp.status_code, 400)
+        self.assertEqual(resp.json()["code"], "MISSING_COOKIE")
+        self.assertEqual(self.calls, [])
+
+    def test_invalid_body(self):
+        for body in ({}, {"urls": []}, {"urls": [1]}, {"urls": [_URL_A], "page": "x"},
+                     {"urls": [_URL_A], "proxies": "http://p1"}, {"urls": [_URL_A], "proxies": [None]}):
+            resp = self.client.post("/search/batch", json=body, headers={"X-Vinted-Cookie": "c=1"})
+            self.assertEqual(resp.status_code, 400, body)
+            self.assertEqual(resp.json()["code"], "INVALID_BODY")
+        self.assertEqual(self.calls, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+"""
+Unit tests for the pooled session eviction paths.
+
+Run from python-bridge/:
+  python -m pytest tests
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import vinted_client
+
+
+class ResetSessionTest(unittest.TestCase):
+    def setUp(self):
+        for patcher in (
+            mock.patch.object(vinted_client, "_ASYNC_CLOSE_GRACE", 0),
+            mock.patch.object(vinted_client, "warm_session"),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(vinted_client._session_pool.clear)
+        self.addCleanup(vinted_client._session_cookie.clear)
+
+    def test_async_sessions_keyed_by_proxy(self):
+        async def main():
+            a = vinted_client._get_async_session(None, "http://p1", "PROXY")
+            b = vinted_client._get_async_session(None, "http://p2", "PROXY")
+            again = vinted_client._get_async_session(None, "http://p1", "PROXY")
+            self.assertIsNot(a, b)
+            self.assertIs(a, again)
+            await a.close()
+            await b.close()
+
+        asyncio.run(main())
+
+    def test_reset_closes_evicted_async_session_on_its_loop(self):
+        async def main():
+            evicted = vinted_client._get_async_session(None, "http://p1", "PROXY")
+            kept = vinted_client._get_async_session(None, "http://p2", "PROXY")
+            # Reset from another thread, as the bridge's threadpool routes do.
+            t = threading.Thread(target=vinted_client.reset_session, args=("http://p1", "PROXY"))
+            t.start()
+            await asyncio.to_thread(t.join)
+            for _ in range(10):
+                if evicted._closed:
+                    break
+                await asyncio.sleep(0.01)
+            self.assertTrue(evicted._closed)
+            self.assertFalse(kept._closed)
+            self.assertIsNot(vinted_client._get_async_session(None, "http://p1", "PROXY"), evicted)
+            self.assertIs(vinted_client._get_async_session(None, "http://p2", "PROXY"), kept)
+            await kept.close()
+
+        asyncio.run(main())
+
+    def test_reset_closes_relist_sessions_for_the_proxy(self):
+        async def main():
+            imp = vinted_client._current_impostor()
+            evicted = vinted_client._get_relist_session("http://p1", "PROXY", imp)
+            kept = vinted_client._get_relist_session("http://p2", "PROXY", imp)
+            vinted_client.reset_session("http://p1", "PROXY")
+            for _ in range(10):
+                if evicted._closed:
+                    break
+                await asyncio.sleep(0.01)
+            self.assertTrue(evicted._closed)
+            self.assertIs(vinted_client._get_relist_session("http://p2", "PROXY", imp), kept)
+            await kept.close()
+
+        asyncio.run(main())
+
+    def test_reset_drops_sync_session_and_rewarms(self):
+        session = vinted_client._get_session(None, "http://p1", "PROXY")
+        vinted_client.reset_session("http://p1", "PROXY")
+        self.assertNotIn(("http://p1", "PROXY"), vinted_client._session_pool)
+        self.assertIsNot(vinted_client._get_session(None, "http://p1", "PROXY"), session)
+
+
+class WarmSessionTest(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(vinted_client._session_pool.clear)
+        self.addCleanup(vinted_client._session_cookie.clear)
+
+    def _join_warmups(self):
+        for t in threading.enumerate():
+            if t.name == "vinted-warmup":
+                t.join(5)
+
+    def test_one_warmup_in_flight_per_key(self):
+        release = threading.Event()
+        warm = mock.Mock(side_effect=lambda *args: release.wait(5))
+        with mock.patch.object(vinted_client, "warm_session", warm):
+            # Resets while p1's warm-up is still running start no new one
+            for _ in range(3):
+                vinted_client.reset_session("http://p1", "PROXY")
+            vinted_client.reset_session("http://p2", "PROXY")
+            release.set()
+            self._join_warmups()
+            self.assertEqual(warm.call_count, 2)
+
+            vinted_client.reset_session("http://p1", "PROXY")
+            self._join_warmups()
+            self.assertEqual(warm.call_count, 3)
+
+    def test_warmup_sends_navigation_headers(self):
+        session = mock.Mock()
+        with mock.patch.object(vinted_client, "_get_session", return_value=session):
+            vinted_client.warm_session(None, "http://p1", "PROXY")
+
+        headers = session.head.call_args.kwargs["headers"]
+        self.assertTrue(headers["Accept"].startswith("text/html"))
+        self.assertEqual(headers["Sec-Fetch-Dest"], "document")
+        self.assertEqual(headers["Sec-Fetch-Mode"], "navigate")
+        self.assertEqual(headers["Sec-Fetch-Site"], "none")
+        self.assertNotIn("Origin", headers)
+        self.assertNotIn("Referer", headers)
+
+
+class ImpersonationRotationTest(unittest.TestCase):
+    UA = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/134.0.0.0 Safari/537.36"
+
+    def setUp(self):
+        patcher = mock.patch.object(vinted_client, "_ASYNC_CLOSE_GRACE", 0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(vinted_client._impostor_state.update, {"index": 0, "cf_strikes": 0})
+        self.addCleanup(vinted_client._session_pool.clear)
+        self.addCleanup(vinted_client._session_cookie.clear)
+
+    def _rotate(self):
+        for _ in range(vinted_client._CF_ROTATE_AFTER):
+            vinted_client._note_cf_challenge()
+
+    def test_headers_follow_rotated_target(self):
+        headers = vinted_client._build_headers("", user_agent=self.UA)
+        self.assertEqual(headers["User-Agent"], self.UA)
+
+        self._rotate()
+        target = vinted_client._current_impostor()
+        self.assertNotEqual(target, vinted_client.IMPOSTOR)
+        version = target.removeprefix("chrome")
+        headers = vinted_client._build_headers("", user_agent=self.UA)
+        self.assertIn(f"Chrome/{version}.0.0.0 ", headers["User-Agent"])
+        self.assertIn(f'"Google Chrome";v="{version}"', headers["Sec-Ch-Ua"])
+        self.assertIn('"Windows"', headers["Sec-Ch-Ua-Platform"])
+
+    def test_html_challenges_count_towards_rotation(self):
+        page = mock.Mock(status_code=200, content=b"<html>datadome captcha</html>", headers={"content-type": "text/html"})
+        session = mock.Mock()
+        session.get.return_value = page
+        with mock.patch.object(vinted_client, "_get_session", return_value=session), \
+                mock.patch.object(vinted_client, "reset_session") as reset:
+            with self.assertRaises(vinted_client.VintedError):
+                vinted_client._fetch_page_html(f"{vinted_client.BASE_URL}/items/1", "c=1", "http://p1", "PROXY")
+            with self.assertRaises(vinted_client.VintedError):
+                vinted_client._verify_session_health("c=1", session, "http://p1", "PROXY")
+
+        self.assertEqual(reset.call_count, 2)
+        self.assertEqual(vinted_client._impostor_state["cf_strikes"], 2)
+
+    def test_rotation_rebuilds_and_closes_pooled_sessions(self):
+        async def main():
+            old_async = vinted_client._get_async_session(None, "http://p1", "PROXY")
+            old_sync = vinted_client._get_session(None, "http://p1", "PROXY")
+            self._rotate()
+            for _ in range(10):
+                if old_async._closed:
+                    break
+                await asyncio.sleep(0.01)
+            self.assertTrue(old_async._closed)
+            new_async = vinted_client._get_async_session(None, "http://p1", "PROXY")
+            self.assertIsNot(new_async, old_async)
+            self.assertIsNot(vinted_client._get_session(None, "http://p1", "PROXY"), old_sync)
+            await new_async.close()
+
+        asyncio.run(main())
+
+
+if __name__ == "__main__":
+    unittest.main()
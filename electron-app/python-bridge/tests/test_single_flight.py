@@ -0,0 +1,221 @@
+"""
+Unit tests for the single-flight request collapsing and the item parse cache.
+
+Run from python-bridge/:
+  python -m pytest tests
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import vinted_client
+from vinted_client import VintedError, _extract_item_from_html, _single_flight
+
+_FOLLOWERS = 5
+
+
+class SingleFlightTest(unittest.TestCase):
+    def _run_concurrently(self, key, fn):
+        """Start a leader inside fn, then followers for the same key while it
+        is blocked; returns [(result, error)] per caller once fn is released."""
+        started = threading.Event()
+        self.release = threading.Event()
+        outcomes = []
+        lock = threading.Lock()
+
+        def blocking():
+            started.set()
+            self.release.wait(5)
+            return fn()
+
+        def call(target):
+            try:
+                outcome = (_single_flight(key, target), None)
+            except BaseException as e:
+                outcome = (None, e)
+            with lock:
+                outcomes.append(outcome)
+
+        leader = threading.Thread(target=call, args=(blocking,))
+        leader.start()
+        self.assertTrue(started.wait(5))
+        followers = [threading.Thread(target=call, args=(blocking,)) for _ in range(_FOLLOWERS)]
+        for t in followers:
+            t.start()
+        # Give the followers time to find the flight and park on it
+        time.sleep(0.1)
+        self.release.set()
+        for t in [leader, *followers]:
+            t.join(5)
+        return outcomes
+
+    def test_concurrent_callers_share_one_call(self):
+        fn = mock.Mock(return_value={"catalogs": [1]})
+        outcomes = self._run_concurrently(("url", None, None), fn)
+
+        fn.assert_called_once()
+        self.assertEqual(len(outcomes), _FOLLOWERS + 1)
+        for result, error in outcomes:
+            self.assertIsNone(error)
+            self.assertIs(result, fn.return_value)
+        self.assertNotIn(("url", None, None), vinted_client._inflight)
+
+    def test_error_reaches_every_waiter(self):
+        err = VintedError("HTTP_ERROR", "boom", 500)
+        fn = mock.Mock(side_effect=err)
+        outcomes = self._run_concurrently(("url", None, None), fn)
+
+        fn.assert_called_once()
+        self.assertEqual(len(outcomes), _FOLLOWERS + 1)
+        for result, error in outcomes:
+            self.assertIsNone(result)
+            self.assertIs(error, err)
+        self.assertNotIn(("url", None, None), vinted_client._inflight)
+
+    def test_sequential_calls_are_not_collapsed(self):
+        fn = mock.Mock(side_effect=[1, 2])
+        self.assertEqual(_single_flight(("url",), fn), 1)
+        self.assertEqual(_single_flight(("url",), fn), 2)
+
+    def test_different_keys_run_separately(self):
+        fn = mock.Mock(side_effect=["a", "b"])
+        self.assertEqual(_single_flight(("a",), fn), "a")
+        self.assertEqual(_single_flight(("b",), fn), "b")
+        self.assertEqual(fn.call_count, 2)
+
+
+class FetchOntologyTest(unittest.TestCase):
+    URL = "https://www.vinted.co.uk/api/v2/item_upload/colors"
+
+    def setUp(self):
+        self.release = threading.Event()
+        self.gets = []
+        lock = threading.Lock()
+
+        def get(url, **kwargs):
+            with lock:
+                self.gets.append((url, kwargs))
+            self.release.wait(5)
+            return mock.Mock(status_code=200)
+
+        self.session = mock.Mock()
+        self.session.get.side_effect = get
+        for patcher in (
+            mock.patch.object(vinted_client, "_get_session", return_value=self.session),
+            mock.patch.object(vinted_client, "_handle_response", side_effect=lambda resp, **kw: {"colors": [1]}),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _fetch_all(self, callers):
+        results = [None] * len(callers)
+
+        def run(i, cookie, ua):
+            results[i] = vinted_client._fetch_ontology(self.URL, cookie, "http://p1", "PROXY", ua)
+
+        threads = [threading.Thread(target=run, args=(i, *c)) for i, c in enumerate(callers)]
+        for t in threads:
+            t.start()
+        time.sleep(0.1)
+        self.release.set()
+        for t in threads:
+            t.join(5)
+        return results
+
+    def test_same_cookie_and_ua_share_a_call_but_not_a_dict(self):
+        results = self._fetch_all([("c=1", "UA")] * 4)
+        self.assertEqual(len(self.gets), 1)
+        self.assertEqual(results, [{"colors": [1]}] * 4)
+        self.assertEqual(len({id(r) for r in results}), 4)
+
+    def test_different_cookie_or_ua_is_not_collapsed(self):
+        self._fetch_all([("c=1", "UA"), ("c=2", "UA"), ("c=1", "UA2")])
+        self.assertEqual(len(self.gets), 3)
+
+    def test_proxy_not_repeated_per_request(self):
+        self._fetch_all([("c=1", "UA")])
+        self.assertNotIn("proxy", self.gets[0][1])
+
+
+class FetchOntologyBundleTest(unittest.TestCase):
+    def test_lookups_run_concurrently_on_one_session(self):
+        gets = []
+
+        async def get(url, **kwargs):
+            gets.append((url, kwargs))
+            # Every request must be in flight before any completes
+            while len(gets) < 4:
+                await asyncio.sleep(0)
+            return mock.Mock(status_code=200, url=url)
+
+        session = mock.Mock()
+        session.get.side_effect = get
+        with mock.patch.object(vinted_client, "_get_async_session", return_value=session) as get_session, \
+                mock.patch.object(vinted_client, "_handle_response", side_effect=lambda resp, **kw: {"url": resp.url}):
+            bundle = asyncio.run(asyncio.wait_for(
+                vinted_client.fetch_ontology_bundle("c=1", catalog_id=5, proxy="http://p1", transport_mode="PROXY"),
+                5,
+            ))
+
+        get_session.assert_called_once_with("c=1", "http://p1", "PROXY")
+        self.assertEqual(list(bundle), ["categories", "colors", "brands", "conditions"])
+        self.assertTrue(bundle["brands"]["url"].endswith("/brands?category_id=5"))
+        self.assertTrue(bundle["conditions"]["url"].endswith("/conditions?catalog_id=5"))
+        self.assertTrue(all("proxy" not in kwargs for _, kwargs in gets))
+
+
+class ItemParseCacheTest(unittest.TestCase):
+    HTML = '<script id="__NUXT_DATA__">[{"id": 1}]</script>'
+
+    def setUp(self):
+        vinted_client._item_parse_cache.clear()
+        self.addCleanup(vinted_client._item_parse_cache.clear)
+        patcher = mock.patch.object(
+            vinted_client, "_parse_item_from_html",
+            side_effect=lambda html, item_id: {"id": item_id, "len": len(html)},
+        )
+        self.parse = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_same_page_is_parsed_once(self):
+        first = _extract_item_from_html(self.HTML, 1)
+        second = _extract_item_from_html(self.HTML, 1)
+        self.assertEqual(first, {"id": 1, "len": len(self.HTML)})
+        self.assertEqual(second, first)
+        self.parse.assert_called_once_with(self.HTML, 1)
+
+    def test_changed_page_or_item_misses(self):
+        _extract_item_from_html(self.HTML, 1)
+        _extract_item_from_html(self.HTML + " ", 1)
+        _extract_item_from_html(self.HTML, 2)
+        self.assertEqual(self.parse.call_count, 3)
+
+    def test_failed_parse_is_cached(self):
+        self.parse.side_effect = None
+        self.parse.return_value = None
+        self.assertIsNone(_extract_item_from_html(self.HTML, 1))
+        self.assertIsNone(_extract_item_from_html(self.HTML, 1))
+        self.parse.assert_called_once()
+
+    def test_bounded_lru(self):
+        with mock.patch.object(vinted_client, "_ITEM_PARSE_CACHE_MAX", 2):
+            _extract_item_from_html(self.HTML, 1)
+            _extract_item_from_html(self.HTML, 2)
+            _extract_item_from_html(self.HTML, 1)  # refresh 1
+            _extract_item_from_html(self.HTML, 3)  # evicts 2
+            self.assertEqual(self.parse.call_count, 3)
+            _extract_item_from_html(self.HTML, 1)
+            self.assertEqual(self.parse.call_count, 3)
+            _extract_item_from_html(self.HTML, 2)
+            self.assertEqual(self.parse.call_count, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+"""
+Unit tests for deadline-aware request timeouts.
+
+Run from python-bridge/:
+  python -m pytest tests
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import vinted_client
+from vinted_client import VintedError, _POLL_TIMEOUT, _deadline_timeout
+
+
+def _effective_total(timeout) -> float:
+    # What curl_cffi hands libcurl as TIMEOUT_MS: connect + read for a tuple
+    return sum(timeout) if isinstance(timeout, tuple) else timeout
+
+
+class DeadlineTimeoutTest(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(vinted_client.time, "monotonic", return_value=1000.0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_no_deadline_keeps_split(self):
+        self.assertEqual(_deadline_timeout(_POLL_TIMEOUT, None), _POLL_TIMEOUT)
+
+    def test_total_never_exceeds_remaining(self):
+        for remaining in (0.01, 0.5, 2.9, 3.0, 4.0, 7.9, 8.0, 8.1, 30.0):
+            timeout = _deadline_timeout(_POLL_TIMEOUT, 1000.0 + remaining)
+            self.assertLessEqual(_effective_total(timeout), remaining, remaining)
+            self.assertLessEqual(_effective_total(timeout), sum(_POLL_TIMEOUT))
+
+    def test_split_kept_when_it_fits(self):
+        self.assertEqual(_deadline_timeout(_POLL_TIMEOUT, 1010.0), _POLL_TIMEOUT)
+
+    def test_passed_deadline_raises(self):
+        with self.assertRaises(VintedError) as ctx:
+            _deadline_timeout(_POLL_TIMEOUT, 1000.0)
+        self.assertEqual(ctx.exception.code, "TIMEOUT")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,31 +3,107 @@ Vinted UK Sniper — Stealth HTTP client using curl_cffi.
 Bypasses Cloudflare/Datadome via TLS fingerprint impersonation.
 """
 
+import asyncio
+import atexit
+import functools
 import json
+import os
 import random
 import re
+import sys
+import threading
 import time
-import uuid
+import weakref
+import zlib
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
 from http.cookies import SimpleCookie
-from urllib.parse import urlencode, urlparse, parse_qs
+from types import MappingProxyType
+from urllib.parse import quote_plus, unquote_plus, urlencode, urlparse
 
-from curl_cffi import requests, CurlMime
+from curl_cffi import requests, CurlECode, CurlHttpVersion, CurlMime, CurlOpt
 
-from image_mutator import mutate_image, jitter_text, mutate_image_for_relist, jitter_text_zwsp
 
-# Impersonate Chrome for JA3/JA4 fingerprint ("chrome131" is a high-trust modern target)
-IMPOSTOR = "chrome131"
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # optional speed-up; stdlib json is a drop-in fallback
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+# Impersonate Chrome for JA3/JA4 fingerprint ("chrome131" is a high-trust modern target).
+# Override with VINTED_IMPERSONATE when a fingerprint starts drawing challenges.
+IMPOSTOR = os.environ.get("VINTED_IMPERSONATE", "chrome131")
 
 BASE_URL = "https://www.vinted.co.uk"
 FALLBACK_USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/134.0.0.0 Safari/537.36"
 
+# SSR extraction patterns (item pages are scraped on every detail fetch)
+_NUXT_DATA_RE = re.compile(
+    r'<script[^>]*(?:id=["\']?__NUXT_DATA__["\']?|data-nuxt-data)[^>]*>(.*?)</script>',
+    re.DOTALL | re.IGNORECASE,
+)
+_LD_JSON_RE = re.compile(
+    r'<script[^>]*type="application/ld\+json"[^>]*>(.*?)</script>',
+    re.DOTALL,
+)
+_NUXT2_RE = re.compile(
+    r"window\.__NUXT__\s*=\s*(\{.+?\})\s*;?\s*</script>",
+    re.DOTALL,
+)
+# Datadome interstitial markers, matched on raw response bytes
+_DATADOME_RE = re.compile(rb"datadome", re.IGNORECASE)
+_CAPTCHA_RE = re.compile(rb"captcha", re.IGNORECASE)
+# Cloudflare/bot-wall markers in transport exception messages
+_CF_RE = re.compile(r"cloudflare|cf-|captcha|blocked", re.IGNORECASE)
+
 
 # ─── Session Pool ────────────────────────────────────────────────────────────
 # Reuse HTTP sessions per proxy to enable HTTP/2 connection reuse and avoid
 # creating a new TLS handshake for every request (a detectable pattern).
 
-_session_pool: dict[tuple[str | None, str | None], requests.Session] = {}
+# Connection tuning, overridable from the environment. VINTED_POOL_SIZE caps
+# concurrent in-flight requests per AsyncSession; over HTTP/2 those are
+# streams multiplexed on one connection. VINTED_HTTP_VERSION picks "1.1",
+# "2", "3" or "auto" (leave it to the impersonation target); the default pins
+# HTTP/2 over TLS so a host can't silently drop us to HTTP/1.1 and lose
+# multiplexing.
+_HTTP_VERSIONS = {
+    "1.1": CurlHttpVersion.V1_1,
+    "2": CurlHttpVersion.V2TLS,
+    "3": CurlHttpVersion.V3,
+    "auto": None,
+}
+_POOL_SIZE = int(os.environ.get("VINTED_POOL_SIZE", "64"))
+_HTTP_VERSION = _HTTP_VERSIONS.get(os.environ.get("VINTED_HTTP_VERSION", "2"), CurlHttpVersion.V2TLS)
+# Bulk fan-out (search_many) keeps at most this many requests in flight, which
+# stays well inside the per-connection stream budget Vinted's edge advertises
+# (SETTINGS_MAX_CONCURRENT_STREAMS, typically 100) even with other traffic
+# sharing the connection.
+_MAX_CONCURRENT_STREAMS = int(os.environ.get("VINTED_MAX_STREAMS", "16"))
+# TCP keepalive probes on every pooled connection: idle HTTP/2 connections
+# between polls would otherwise be silently dropped by NAT/proxy idle
+# timeouts, forcing a full TLS redial on the next request.
+_CURL_OPTIONS = {
+    CurlOpt.TCP_KEEPALIVE: 1,
+    CurlOpt.TCP_KEEPIDLE: 30,
+    CurlOpt.TCP_KEEPINTVL: 15,
+}
 
+_session_pool: dict[tuple[str | None, str | None], requests.Session] = {}
+# Last cookie string injected into each pooled session; re-parsing the same
+# cookie header on every poll is wasted work.
+_session_cookie: dict[tuple[str | None, str | None], str] = {}
+# Guards _session_pool, _session_cookie, _async_session_pool and
+# _relist_session_pool: they are touched from the bridge's threadpool, the
+# event loop and warm-up threads.
+_session_pool_lock = threading.Lock()
+# An evicted AsyncSession is closed on its own loop after this long, so
+# requests already in flight on it (uploads run up to 60s) can finish.
+_ASYNC_CLOSE_GRACE = 60.0
 
 
 def _inject_cookies(session: requests.Session, cookie_str: str | None) -> None:
@@ -44,93 +120,392 @@ def _inject_cookies(session: requests.Session, cookie_str: str | None) -> None:
 def _get_session(cookie: str | None = None, proxy: str | None = None, transport_mode: str | None = None) -> requests.Session:
     """Get or create a reusable session for the given proxy and transport mode."""
     key = (proxy, transport_mode)
-    if key not in _session_pool:
-        # Use 'chrome' impersonation universally to avoid TLS vs Header mismatch
-        _session_pool[key] = requests.Session(impersonate=IMPOSTOR)
-    _inject_cookies(_session_pool[key], cookie)
-    return _session_pool[key]
+    with _session_pool_lock:
+        session = _session_pool.get(key)
+        if session is None:
+            # Use 'chrome' impersonation universally to avoid TLS vs Header mismatch.
+            # The proxy is bound at session level (never for DIRECT) so callers
+            # need not repeat it per request.
+            session_proxy = proxy if proxy and transport_mode != "DIRECT" else None
+            session = _session_pool[key] = requests.Session(
+                impersonate=_current_impostor(), proxy=session_proxy, http_version=_HTTP_VERSION,
+                curl_options=_CURL_OPTIONS,
+            )
+        if cookie and _session_cookie.get(key) != cookie:
+            _inject_cookies(session, cookie)
+            _session_cookie[key] = cookie
+    return session
+
+
+def warm_session(cookie: str | None = None, proxy: str | None = None, transport_mode: str | None = None) -> None:
+    """Create the pooled session for (proxy, transport_mode) and HEAD the site
+    root through it, so DNS, proxy CONNECT and the TLS handshake (and any
+    fresh datadome cookie) are done before the first real request.
+    Best-effort: failures are ignored."""
+    session = _get_session(cookie, proxy, transport_mode)
+    # Sent as a typed-in top-level navigation, like a browser opening the
+    # site, rather than as an API fetch from a page that was never loaded
+    headers = _build_headers(cookie or "", transport_mode=transport_mode)
+    del headers["Origin"], headers["Referer"]
+    headers["Accept"] = (
+        "text/html,application/xhtml+xml,application/xml;q=0.9,"
+        "image/avif,image/webp,image/apng,*/*;q=0.8"
+    )
+    headers["Sec-Fetch-Dest"] = "document"
+    headers["Sec-Fetch-Mode"] = "navigate"
+    headers["Sec-Fetch-Site"] = "none"
+    headers["Sec-Fetch-User"] = "?1"
+    headers["Upgrade-Insecure-Requests"] = "1"
+    try:
+        session.head(BASE_URL, headers=headers, timeout=10)
+    except Exception:
+        pass
+
+
+# (proxy, transport_mode) keys with a post-reset warm-up thread running, so a
+# burst of challenges on one proxy starts a single warm-up. Guarded by
+# _session_pool_lock.
+_warming: set[tuple[str | None, str | None]] = set()
+
+
+def _warm_after_reset(proxy: str | None, transport_mode: str | None) -> None:
+    try:
+        warm_session(None, proxy, transport_mode)
+    finally:
+        with _session_pool_lock:
+            _warming.discard((proxy, transport_mode))
 
 
 def reset_session(proxy: str | None = None, transport_mode: str | None = None) -> None:
     """Drop a cached session (e.g. after a Datadome challenge).
-    The next call to _get_session will create a fresh one."""
+    A replacement is created and warmed in the background so the next
+    request doesn't pay the cold handshake; at most one warm-up runs per
+    (proxy, transport_mode)."""
+    key = (proxy, transport_mode)
+    with _session_pool_lock:
+        # Evicted sync sessions free their curl handles once the last
+        # in-flight request drops its reference.
+        _session_pool.pop(key, None)
+        _session_cookie.pop(key, None)
+        evicted = [
+            (loop, entry[0])
+            for loop, pool in list(_async_session_pool.items())
+            if (entry := pool.pop(key, None)) is not None
+        ]
+        relist_proxy = proxy if proxy and transport_mode != "DIRECT" else None
+        for loop, pool in list(_relist_session_pool.items()):
+            for relist_key in [k for k in pool if k[0] == relist_proxy]:
+                evicted.append((loop, pool.pop(relist_key)))
+        start_warmup = key not in _warming
+        _warming.add(key)
+    _close_async_sessions(evicted)
+    if start_warmup:
+        threading.Thread(
+            target=_warm_after_reset, args=(proxy, transport_mode),
+            name="vinted-warmup", daemon=True,
+        ).start()
+
+
+def _close_async_sessions(evicted: list[tuple[asyncio.AbstractEventLoop, requests.AsyncSession]]) -> None:
+    """Close evicted AsyncSessions on the loops that own them, after
+    _ASYNC_CLOSE_GRACE. Closing is loop-bound, so it can't be done from the
+    evicting thread, and dropping the session alone would leak its curl
+    multi handle and timer task."""
+
+    async def _close_later(session: requests.AsyncSession) -> None:
+        await asyncio.sleep(_ASYNC_CLOSE_GRACE)
+        await session.close()
+
+    for loop, session in evicted:
+        if loop.is_closed():
+            continue
+        try:
+            asyncio.run_coroutine_threadsafe(_close_later(session), loop)
+        except RuntimeError:
+            pass  # loop closed in between
+
+
+# Async sessions for the *_async endpoint variants. An AsyncSession is tied to
+# the event loop it first ran on, so the pool is kept per loop and dropped
+# along with it. Like the sync pool there is one session per (proxy,
+# transport_mode) with the proxy bound at session level: a jar shared across
+# proxies would replay one exit IP's datadome cookie from another, which
+# Datadome treats as a stolen session. Entries are [session, last injected
+# cookie].
+_async_session_pool: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _get_async_session(
+    cookie: str | None = None, proxy: str | None = None, transport_mode: str | None = None,
+) -> requests.AsyncSession:
+    """Get or create the AsyncSession for (proxy, transport_mode) on the running loop."""
+    loop = asyncio.get_running_loop()
     key = (proxy, transport_mode)
-    _session_pool.pop(key, None)
+    with _session_pool_lock:
+        pool = _async_session_pool.setdefault(loop, {})
+        entry = pool.get(key)
+        if entry is None:
+            session_proxy = proxy if proxy and transport_mode != "DIRECT" else None
+            session = requests.AsyncSession(
+                impersonate=_current_impostor(), proxy=session_proxy, max_clients=_POOL_SIZE,
+                http_version=_HTTP_VERSION, curl_options=_CURL_OPTIONS,
+            )
+            entry = pool[key] = [session, None]
+        session = entry[0]
+        if cookie and entry[1] != cookie:
+            _inject_cookies(session, cookie)
+            entry[1] = cookie
+    return session
+
+
+# Relist sequences use their own sticky AsyncSession (separate cookie jar from
+# the shared pool), kept per loop and (proxy, impersonate target) so
+# back-to-back relists during a bulk restock reuse warm connections. Bounded
+# per loop with FIFO eviction.
+_RELIST_POOL_MAX = 32
+_relist_session_pool: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _get_relist_session(
+    proxy: str | None, transport_mode: str | None, impersonate: str,
+) -> requests.AsyncSession:
+    """Get or create the sticky relist session for (proxy, impersonate) on the running loop."""
+    loop = asyncio.get_running_loop()
+    session_proxy = proxy if proxy and transport_mode != "DIRECT" else None
+    key = (session_proxy, impersonate)
+    evicted = []
+    with _session_pool_lock:
+        pool = _relist_session_pool.setdefault(loop, {})
+        session = pool.get(key)
+        if session is None:
+            if len(pool) >= _RELIST_POOL_MAX:
+                evicted.append((loop, pool.pop(next(iter(pool)))))
+            session = pool[key] = requests.AsyncSession(
+                impersonate=impersonate, proxy=session_proxy, http_version=_HTTP_VERSION,
+                curl_options=_CURL_OPTIONS,
+            )
+    _close_async_sessions(evicted)
+    return session
+
+
+def _discard_relist_session(session: requests.AsyncSession) -> None:
+    """Evict a pooled relist session, e.g. after a 403. _inject_cookies never
+    overwrites a datadome cookie the session already holds, so a burned one
+    would otherwise ride along on every later relist through that proxy."""
+    loop = asyncio.get_running_loop()
+    with _session_pool_lock:
+        pool = _relist_session_pool.get(loop, {})
+        evicted = [(loop, pool.pop(key)) for key, pooled in list(pool.items()) if pooled is session]
+    _close_async_sessions(evicted)
+
+
+# ─── Impersonation Rotation ──────────────────────────────────────────────────
+# Repeated Cloudflare/Datadome challenges usually mean the current TLS
+# fingerprint is being flagged. After _CF_ROTATE_AFTER challenges in a row the
+# shared pools move to the next target and are rebuilt from scratch. Only
+# Chrome targets are used, and once rotated the User-Agent/Sec-Ch-Ua we send
+# are moved to the target's Chrome version, so headers and TLS fingerprint
+# never disagree about which browser is talking.
+
+_IMPOSTOR_CHAIN = tuple(dict.fromkeys((IMPOSTOR, "chrome131", "chrome124", "chrome120")))
+_CF_ROTATE_AFTER = 3
+_impostor_state = {"index": 0, "cf_strikes": 0}
+_impostor_lock = threading.Lock()
+
+
+def _current_impostor() -> str:
+    return _IMPOSTOR_CHAIN[_impostor_state["index"]]
+
+
+def _note_cf_challenge() -> None:
+    """Count a bot challenge; rotate the impersonation target once too many
+    arrive in a row. Concurrent callers share the state so they converge on
+    the same target instead of each rotating."""
+    with _impostor_lock:
+        _impostor_state["cf_strikes"] += 1
+        if _impostor_state["cf_strikes"] < _CF_ROTATE_AFTER:
+            return
+        _impostor_state["cf_strikes"] = 0
+        _impostor_state["index"] = (_impostor_state["index"] + 1) % len(_IMPOSTOR_CHAIN)
+        with _session_pool_lock:
+            _session_pool.clear()
+            _session_cookie.clear()
+            evicted = []
+            for loop, pool in list(_async_session_pool.items()):
+                evicted.extend((loop, entry[0]) for entry in pool.values())
+                pool.clear()
+        _close_async_sessions(evicted)
+        print(f"[vinted_client] impersonation rotated to {_current_impostor()}", file=sys.stderr)
+
+
+@functools.lru_cache(maxsize=16)
+def _impostor_ua(ua: str, target: str) -> str:
+    """ua with its Chrome major version moved to target's. Only applied after
+    a rotation: on the configured target the real browser UA is sent as is."""
+    match = re.match(r"chrome(\d+)", target)
+    if target == IMPOSTOR or not match:
+        return ua
+    return re.sub(r"Chrome/[\d.]+", f"Chrome/{match.group(1)}.0.0.0", ua, count=1)
+
+
+def _note_clean_response() -> None:
+    """A response got through unchallenged: the strike run is broken."""
+    with _impostor_lock:
+        _impostor_state["cf_strikes"] = 0
+
+
+# ─── Single-Flight ───────────────────────────────────────────────────────────
+# Bridge routes run on a thread pool, so identical GETs fired at the same time
+# would otherwise each hit Vinted. The first caller for a key does the request;
+# the rest wait for and share its result (or exception).
+
+
+class _Flight:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: object = None
+        self.error: BaseException | None = None
+
+
+_inflight: dict[tuple, _Flight] = {}
+_inflight_lock = threading.Lock()
+
+
+def _single_flight(key: tuple, fn):
+    """Run fn() once per key across concurrent callers."""
+    with _inflight_lock:
+        flight = _inflight.get(key)
+        leader = flight is None
+        if leader:
+            flight = _inflight[key] = _Flight()
+
+    if not leader:
+        flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.result
+
+    try:
+        flight.result = fn()
+        return flight.result
+    except BaseException as e:
+        flight.error = e
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+        flight.done.set()
 
 
 class VintedError(Exception):
     """Structured error for Electron consumption."""
 
-    def __init__(self, code: str, message: str, status_code: int | None = None):
+    def __init__(
+        self,
+        code: str,
+        message: str,
+        status_code: int | None = None,
+        retry_after: float | None = None,
+    ):
         self.code = code
         self.message = message
         self.status_code = status_code
+        # Seconds the server asked us to wait (Retry-After on a 429), if given
+        self.retry_after = retry_after
         super().__init__(message)
 
 
-def _parse_catalog_url(url: str) -> dict:
+def _retry_after_seconds(resp) -> float | None:
+    """Numeric Retry-After header value, or None if absent/unparseable."""
+    try:
+        return float(resp.headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_catalog_url(url: str) -> MappingProxyType:
     """Extract ALL query params from a Vinted catalog URL.
-    Preserves filter parameters (catalog[], color_ids[], brand_ids[], etc.)."""
+    Preserves filter parameters (catalog[], color_ids[], brand_ids[], etc.).
+    Cached because the same catalog URLs are polled every tick, so the
+    result is read-only: _raw_query is a tuple of (key, values) pairs."""
     parsed = urlparse(url)
     if "vinted.co.uk" not in parsed.netloc:
         raise VintedError("INVALID_URL", f"Not a Vinted catalog URL: {url}")
-    query = parse_qs(parsed.query)
-    # Return the full parsed query dict plus defaults for paging
-    return {
-        "_raw_query": query,
+    # Single split/partition pass; same result as parse_qs (blank values
+    # dropped, repeated keys collected in order) without its extra passes.
+    query: dict[str, list[str]] = {}
+    for part in parsed.query.split("&"):
+        key, _, val = part.partition("=")
+        if val:
+            query.setdefault(unquote_plus(key), []).append(unquote_plus(val))
+    # Return the full parsed query plus defaults for paging
+    return MappingProxyType({
+        "_raw_query": tuple((key, tuple(values)) for key, values in query.items()),
         "order": query.get("order", ["newest_first"])[0],
         "page": int(query.get("page", ["1"])[0]),
         "per_page": int(query.get("per_page", ["96"])[0]),
-    }
+    })
 
 
-def _build_search_params(params: dict) -> str:
-    """Build the full query string for catalog/items endpoint.
-    Passes through ALL filter parameters from the original URL.
-    Maps frontend URL param names to Vinted API param names where they differ."""
+# Frontend URL → API endpoint parameter name mapping.
+# The Vinted website uses 'catalog[]' in browser URLs but the API
+# endpoint /api/v2/catalog/items expects 'catalog_ids[]'.
+_PARAM_REMAP: dict[str, str] = {
+    "catalog[]": "catalog_ids[]",
+}
 
-    # Frontend URL → API endpoint parameter name mapping.
-    # The Vinted website uses 'catalog[]' in browser URLs but the API
-    # endpoint /api/v2/catalog/items expects 'catalog_ids[]'.
-    PARAM_REMAP: dict[str, str] = {
-        "catalog[]": "catalog_ids[]",
-    }
 
-    raw_query = params.get("_raw_query", {})
+@functools.lru_cache(maxsize=512)
+def _catalog_query_parts(url: str) -> tuple[str, str]:
+    """Build the catalog/items query string for a catalog URL, split around
+    the page number: the result is (prefix, suffix) and the full query is
+    f"{prefix}{page}{suffix}". Passes through ALL filter parameters from the
+    original URL, remapping names where frontend and API differ. Only the
+    page changes between polls, so everything else is built once per URL."""
+    params = _parse_catalog_url(url)
     # Start with the raw query params (preserves color_ids[], brand_ids[], etc.)
-    parts: list[tuple[str, str]] = []
-    for key, values in raw_query.items():
-        # Skip page/per_page/order — we set them explicitly below
+    # Keys keep their brackets unencoded since Vinted's API expects raw []
+    # in array params; values are encoded exactly as urlencode would.
+    parts: list[str] = []
+    for key, values in params["_raw_query"]:
+        # Skip page/per_page/order — we set them explicitly
         if key in ("page", "per_page", "order"):
             continue
-        # Remap parameter names where frontend and API differ
-        api_key = PARAM_REMAP.get(key, key)
+        api_key = quote_plus(_PARAM_REMAP.get(key, key), safe="[]")
         for val in values:
-            parts.append((api_key, val))
-    # Add our controlled paging/ordering params
-    parts.append(("page", str(params.get("page", 1))))
-    parts.append(("per_page", str(params.get("per_page", 96))))
-    parts.append(("order", params.get("order", "newest_first")))
-    # urlencode encodes [] as %5B%5D; replace back to raw brackets
-    # since Vinted's API expects unencoded brackets in array params
-    qs = urlencode(parts)
-    qs = qs.replace("%5B%5D", "[]")
-    return qs
+            parts.append(f"{api_key}={quote_plus(val)}")
+    parts.append("page=")
+    prefix = "&".join(parts)
+    suffix = f"&per_page={params['per_page']}&order={quote_plus(params['order'])}"
+    return prefix, suffix
 
 
-def _build_headers(
-    cookie: str,
-    referer: str | None = None,
-    transport_mode: str | None = None,
-    user_agent: str | None = None,
-) -> dict:
-    """Build request headers perfectly aligned with the user's real browser session."""
-    ua = user_agent or "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-    
+@functools.lru_cache(maxsize=1024)
+def _catalog_query(url: str, page: int) -> str:
+    """Full catalog/items query string for (url, page). Saved searches are
+    mostly polled at page 1, so this is normally a single cache hit."""
+    prefix, suffix = _catalog_query_parts(url)
+    return f"{prefix}{page}{suffix}"
+
+
+_DEFAULT_REFERER = f"{BASE_URL}/catalog"
+_CATALOG_ITEMS_URL = f"{BASE_URL}/api/v2/catalog/items"
+_CHECKOUT_BUILD_URL = f"{BASE_URL}/api/v2/purchases/checkout/build"
+_PURCHASES_PREFIX = f"{BASE_URL}/api/v2/purchases/"
+_SHIPPING_PREFIX = f"{BASE_URL}/api/v2/shipping_orders/"
+
+
+@functools.lru_cache(maxsize=8)
+def _base_headers(ua: str) -> MappingProxyType:
+    """Static header template for a User-Agent (everything but Referer).
+    Built once per UA; callers get a fresh dict from _build_headers."""
     # Dynamically derive Chrome version from User-Agent
     match = re.search(r'Chrome/(\d+)', ua)
     chrome_version = match.group(1) if match else "131"
-    
+
     # Dynamically derive Platform from User-Agent
     platform = '"macOS"'
     if "Windows" in ua:
@@ -140,12 +515,12 @@ def _build_headers(
     elif "Linux" in ua:
         platform = '"Linux"'
 
-    headers = {
+    return MappingProxyType({
         "Accept": "application/json, text/plain, */*",
         "Accept-Encoding": "gzip, deflate, br, zstd",
         "Accept-Language": "en-GB,en;q=0.9",
         "Origin": BASE_URL,
-        "Referer": referer or f"{BASE_URL}/catalog",
+        "Referer": _DEFAULT_REFERER,
         "Sec-Ch-Ua": f'"Chromium";v="{chrome_version}", "Google Chrome";v="{chrome_version}", "Not_A Brand";v="24"',
         "Sec-Ch-Ua-Mobile": "?0",
         "Sec-Ch-Ua-Platform": platform,
@@ -153,9 +528,29 @@ def _build_headers(
         "Sec-Fetch-Mode": "cors",
         "Sec-Fetch-Site": "same-origin",
         "User-Agent": ua,
-    }
+    })
+
+
+@functools.lru_cache(maxsize=64)
+def _headers_template(ua: str, referer: str) -> MappingProxyType:
+    """Complete read-only header set for (UA, Referer). Pollers hit the same
+    few referers over and over, so each request is a single dict copy."""
+    if referer == _DEFAULT_REFERER:
+        return _base_headers(ua)
+    return MappingProxyType({**_base_headers(ua), "Referer": referer})
+
+
+def _build_headers(
+    cookie: str,
+    referer: str | None = None,
+    transport_mode: str | None = None,
+    user_agent: str | None = None,
+) -> dict:
+    """Build request headers perfectly aligned with the user's real browser session."""
+    ua = user_agent or "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+    ua = _impostor_ua(ua, _current_impostor())
     # Cookie injection is now handled cleanly by _get_session interacting with session.cookies
-    return headers
+    return dict(_headers_template(ua, referer or _DEFAULT_REFERER))
 
 
 def _extract_csrf_from_cookie(cookie: str) -> str | None:
@@ -279,9 +674,10 @@ def _detect_challenge(resp, proxy: str | None = None, transport_mode: str | None
     next request after a browser refresh gets a clean TLS connection."""
     content_type = resp.headers.get("content-type", "")
     if "text/html" in content_type:
-        body_start = resp.text[:500].lower()
-        if "datadome" in body_start or "<!doctype" in body_start or "<html" in body_start:
+        body_start = resp.content[:512].lower()
+        if b"datadome" in body_start or b"<!doctype" in body_start or b"<html" in body_start:
             reset_session(proxy, transport_mode)
+            _note_cf_challenge()
             raise VintedError(
                 "DATADOME_CHALLENGE",
                 "Bot challenge detected -- refresh session in browser",
@@ -289,33 +685,157 @@ def _detect_challenge(resp, proxy: str | None = None, transport_mode: str | None
             )
 
 
+_BACKOFF_MAX_ATTEMPTS = 5
+_BACKOFF_CAP_SECONDS = 32.0
+# Total sleep allowed across retries on the sync path, which holds one of the
+# bridge's threadpool workers while it waits. Past this the 429 is returned
+# and surfaces as RATE_LIMITED with its retry_after, for the caller to honor.
+_BACKOFF_SYNC_BUDGET_SECONDS = 8.0
+
+
+def _request_with_backoff(method, **req_kwargs):
+    """Issue session.get/post/put, retrying HTTP 429 up to 5 attempts.
+    Honors a numeric Retry-After header; otherwise backs off exponentially
+    (1s, 2s, 4s, 8s) with jitter. Gives up early once the next wait would
+    exceed _BACKOFF_SYNC_BUDGET_SECONDS in total. Returns the final response
+    so the caller's _handle_response still maps a persistent 429."""
+    slept = 0.0
+    for attempt in range(_BACKOFF_MAX_ATTEMPTS):
+        resp = method(**req_kwargs)
+        if resp.status_code != 429 or attempt == _BACKOFF_MAX_ATTEMPTS - 1:
+            return resp
+        delay = _retry_after_seconds(resp)
+        if delay is None:
+            delay = (2 ** attempt) * random.uniform(0.5, 1.0)
+        delay = min(max(delay, 0.0), _BACKOFF_CAP_SECONDS)
+        if slept + delay > _BACKOFF_SYNC_BUDGET_SECONDS:
+            return resp
+        time.sleep(delay)
+        slept += delay
+    return resp
+
+
+async def _request_with_backoff_async(method, **req_kwargs):
+    """_request_with_backoff for AsyncSession methods; sleeps without
+    blocking the event loop, so only the 32s per-wait cap applies."""
+    for attempt in range(_BACKOFF_MAX_ATTEMPTS):
+        resp = await method(**req_kwargs)
+        if resp.status_code != 429 or attempt == _BACKOFF_MAX_ATTEMPTS - 1:
+            return resp
+        delay = _retry_after_seconds(resp)
+        if delay is None:
+            delay = (2 ** attempt) * random.uniform(0.5, 1.0)
+        await asyncio.sleep(min(max(delay, 0.0), _BACKOFF_CAP_SECONDS))
+    return resp
+
+
 def _handle_response(resp, allow_statuses: tuple = (200,), proxy: str | None = None) -> dict:
     """Common response status handling. Raises VintedError on failure."""
-    if resp.status_code == 401:
-        raise VintedError("SESSION_EXPIRED", "Session expired or invalid cookie", 401)
     if resp.status_code == 403:
-        body_preview = ""
-        try:
-            body_preview = resp.text[:500]
-        except Exception:
-            pass
+        # Keep the body here: it usually says which bot wall we hit
+        body_preview = _body_preview(resp, 500)
         raise VintedError("FORBIDDEN", f"Access forbidden (403): {body_preview}" if body_preview else "Access forbidden (bot detection?)", 403)
-    if resp.status_code == 429:
-        raise VintedError("RATE_LIMITED", "Too many requests", 429)
-    if resp.status_code not in allow_statuses:
-        raise VintedError(
-            "HTTP_ERROR",
-            f"HTTP {resp.status_code}: {resp.text[:300]}",
-            resp.status_code,
-        )
+    _raise_for_status(resp, ok=allow_statuses)
     # Detect HTML challenge pages that slip through with a 200 status
-    _detect_challenge(resp, proxy)
+    return _json_body(resp, proxy, None)
+
+
+# Status codes that map to a fixed error regardless of endpoint
+_STATUS_ERRORS: dict[int, tuple[str, str]] = {
+    401: ("SESSION_EXPIRED", "Session expired or invalid cookie"),
+    403: ("FORBIDDEN", "Access forbidden (bot detection?)"),
+    429: ("RATE_LIMITED", "Too many requests"),
+}
+
+
+def _body_preview(resp, limit: int) -> str:
+    """First `limit` bytes of the body as text, without decoding the whole
+    (possibly 50KB+ challenge page) body the way resp.text would."""
+    return resp.content[:limit].decode("utf-8", "replace")
+
+
+def _raise_for_status(resp, ok: tuple = (200,)) -> None:
+    """Raise the VintedError for a non-OK status (see _STATUS_ERRORS)."""
+    sc = resp.status_code
+    if sc in ok:
+        return
+    info = _STATUS_ERRORS.get(sc)
+    if info:
+        retry_after = _retry_after_seconds(resp) if sc == 429 else None
+        raise VintedError(info[0], info[1], sc, retry_after=retry_after)
+    raise VintedError("HTTP_ERROR", f"HTTP {sc}: {_body_preview(resp, 200)}", sc)
+
+
+def _json_body(resp, proxy: str | None, transport_mode: str | None) -> dict:
+    """Decode a successful JSON response, catching HTML challenge pages."""
+    _detect_challenge(resp, proxy, transport_mode)
+    _note_clean_response()
     try:
-        return resp.json()
-    except Exception as e:
+        return _json_loads(resp.content)
+    except ValueError as e:
         raise VintedError("PARSE_ERROR", f"Invalid JSON: {e}")
 
 
+# (connect, read) timeouts for the sniper endpoints. A stalled poll should fail
+# fast and free its slot for the next attempt; checkout steps get a longer
+# read budget since Vinted can be slow to price/reserve a purchase.
+_POLL_TIMEOUT = (3.0, 5.0)
+_CHECKOUT_TIMEOUT = (3.0, 30.0)
+
+
+def _deadline_timeout(timeout: tuple[float, float], deadline: float | None) -> tuple[float, float] | float:
+    """Clamp a (connect, read) timeout to what is left of a time.monotonic()
+    deadline. Raises TIMEOUT if the deadline has already passed.
+    curl_cffi turns a tuple into CONNECTTIMEOUT=connect and TIMEOUT=connect+read,
+    so it is the sum that must fit; when it doesn't, the remaining time is
+    returned as a scalar, which caps connect and the whole transfer at once."""
+    if deadline is None:
+        return timeout
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise VintedError("TIMEOUT", "Deadline exceeded before request was sent")
+    if timeout[0] + timeout[1] <= remaining:
+        return timeout
+    return remaining
+
+
+def _request_failure(e: Exception) -> VintedError:
+    """Map a transport-level exception to a VintedError."""
+    if isinstance(e, VintedError):
+        return e
+    if isinstance(e, requests.errors.RequestsError):
+        if getattr(e, "code", None) == CurlECode.OPERATION_TIMEDOUT:
+            return VintedError("TIMEOUT", str(e))
+        return VintedError("REQUEST_FAILED", str(e))
+    msg = str(e)
+    if _CF_RE.search(msg):
+        _note_cf_challenge()
+        return VintedError("CF_CHALLENGE", f"Cloudflare challenge: {msg}", None)
+    return VintedError("UNKNOWN", msg)
+
+
+def _search_request(
+    url: str,
+    cookie: str,
+    page: int,
+    transport_mode: str | None,
+    user_agent: str | None,
+    deadline: float | None = None,
+) -> dict:
+    qs = _catalog_query(url, page)
+    referer = url if url.startswith("http") else _DEFAULT_REFERER
+    return {
+        "url": f"{_CATALOG_ITEMS_URL}?{qs}",
+        "headers": _build_headers(cookie, referer, transport_mode, user_agent=user_agent),
+        "timeout": _deadline_timeout(_POLL_TIMEOUT, deadline),
+    }
+
+
+def _search_response(resp, proxy: str | None, transport_mode: str | None) -> dict:
+    _raise_for_status(resp)
+    return _json_body(resp, proxy, transport_mode)
+
+
 def search(
     url: str,
     cookie: str,
@@ -323,59 +843,69 @@ def search(
     page: int = 1,
     transport_mode: str | None = None,
     user_agent: str | None = None,
+    deadline: float | None = None,
 ) -> dict:
     """
     Fetch catalog items from a Vinted search/catalog URL.
     Uses /api/v2/catalog/items with params parsed from URL.
+    deadline is an optional time.monotonic() value the request must finish by.
     """
-    params = _parse_catalog_url(url)
-    params["page"] = page
-    qs = _build_search_params(params)
-    api_url = f"{BASE_URL}/api/v2/catalog/items?{qs}"
-    referer = url if url.startswith("http") else f"{BASE_URL}/catalog"
-
+    req_kwargs = _search_request(url, cookie, page, transport_mode, user_agent, deadline)
     session = _get_session(cookie, proxy, transport_mode)
-    req_kwargs: dict = {
-        "url": api_url,
-        "headers": _build_headers(cookie, referer, transport_mode, user_agent=user_agent),
-        "timeout": 30,
-    }
-    # Safety: DIRECT mode must never use a proxy, regardless of what was passed.
-    if proxy and transport_mode != "DIRECT":
-        req_kwargs["proxy"] = proxy
-
     try:
         resp = session.get(**req_kwargs)
-    except requests.errors.RequestsError as e:
-        raise VintedError("REQUEST_FAILED", str(e))
     except Exception as e:
-        msg = str(e)
-        if "cloudflare" in msg.lower() or "cf-" in msg.lower():
-            raise VintedError("CF_CHALLENGE", f"Cloudflare challenge: {msg}", None)
-        if "blocked" in msg.lower() or "captcha" in msg.lower():
-            raise VintedError("CF_CHALLENGE", msg, None)
-        raise VintedError("UNKNOWN", msg)
+        raise _request_failure(e)
+    return _search_response(resp, proxy, transport_mode)
 
-    if resp.status_code == 401:
-        raise VintedError("SESSION_EXPIRED", "Session expired or invalid cookie", 401)
-    if resp.status_code == 403:
-        raise VintedError("FORBIDDEN", "Access forbidden (bot detection?)", 403)
-    if resp.status_code == 429:
-        raise VintedError("RATE_LIMITED", "Too many requests", 429)
-    if resp.status_code != 200:
-        raise VintedError(
-            "HTTP_ERROR",
-            f"HTTP {resp.status_code}: {resp.text[:200]}",
-            resp.status_code,
-        )
 
-    _detect_challenge(resp, proxy, transport_mode)
+async def search_async(
+    url: str,
+    cookie: str,
+    proxy: str | None = None,
+    page: int = 1,
+    transport_mode: str | None = None,
+    user_agent: str | None = None,
+    deadline: float | None = None,
+) -> dict:
+    """Async variant of search() on the pooled AsyncSession."""
+    req_kwargs = _search_request(url, cookie, page, transport_mode, user_agent, deadline)
+    session = _get_async_session(cookie, proxy, transport_mode)
     try:
-        _resp_data = resp.json()
+        resp = await session.get(**req_kwargs)
     except Exception as e:
-        raise VintedError("PARSE_ERROR", f"Invalid JSON: {e}")
+        raise _request_failure(e)
+    return _search_response(resp, proxy, transport_mode)
+
 
-    return _resp_data
+async def search_many(
+    urls: list[str],
+    cookie: str,
+    proxies: list[str | None] | None = None,
+    page: int = 1,
+    transport_mode: str | None = None,
+    user_agent: str | None = None,
+    deadline: float | None = None,
+) -> list[dict | VintedError]:
+    """Poll several catalog URLs concurrently on one event loop, at most
+    _MAX_CONCURRENT_STREAMS in flight. Proxies are assigned round-robin.
+    Results come back in URL order; a failed search yields its VintedError
+    in place rather than aborting the whole batch."""
+    proxies = proxies or [None]
+    streams = asyncio.Semaphore(_MAX_CONCURRENT_STREAMS)
+
+    async def _one(i: int, url: str) -> dict:
+        async with streams:
+            return await search_async(url, cookie, proxies[i % len(proxies)], page, transport_mode, user_agent, deadline)
+
+    results = await asyncio.gather(
+        *(_one(i, url) for i, url in enumerate(urls)),
+        return_exceptions=True,
+    )
+    return [
+        r if isinstance(r, (dict, VintedError)) else _request_failure(r)
+        for r in results
+    ]
 
 
 def fetch_item_json(
@@ -425,6 +955,34 @@ def fetch_item_json(
     return _handle_response(resp, proxy=proxy)
 
 
+def _checkout_build_request(
+    order_id: int,
+    cookie: str,
+    csrf_token: str | None,
+    anon_id: str | None,
+    transport_mode: str | None,
+    user_agent: str | None,
+) -> dict:
+    return {
+        "url": _CHECKOUT_BUILD_URL,
+        "headers": _build_write_headers(cookie, csrf_token=csrf_token, anon_id=anon_id, referer=f"{BASE_URL}/checkout", transport_mode=transport_mode, user_agent=user_agent),
+        "data": _json_dumps({"purchase_items": [{"id": order_id, "type": "transaction"}]}),
+        "timeout": _CHECKOUT_TIMEOUT,
+    }
+
+
+def _checkout_build_response(resp, proxy: str | None, transport_mode: str | None) -> dict:
+    sc = resp.status_code
+    if sc == 403:
+        body = _body_preview(resp, 500)
+        raise VintedError("FORBIDDEN", f"Access forbidden (checkout/build): {body}", 403)
+    if sc not in (200, 201) and sc not in _STATUS_ERRORS:
+        if b"already has a payment" in resp.content[:500]:
+            raise VintedError("PAYMENT_IN_PROGRESS", "This item already has a payment in progress — it may be reserved by another buyer or a previous attempt.", sc)
+    _raise_for_status(resp, ok=(200, 201))
+    return _json_body(resp, proxy, transport_mode)
+
+
 def checkout_build(
     order_id: int,
     cookie: str,
@@ -437,53 +995,54 @@ def checkout_build(
     """
     Initiate checkout: POST /api/v2/purchases/checkout/build
     """
-    api_url = f"{BASE_URL}/api/v2/purchases/checkout/build"
-    payload = {"purchase_items": [{"id": order_id, "type": "transaction"}]}
-
+    req_kwargs = _checkout_build_request(order_id, cookie, csrf_token, anon_id, transport_mode, user_agent)
     session = _get_session(cookie, proxy, transport_mode)
-    headers = _build_write_headers(cookie, csrf_token=csrf_token, anon_id=anon_id, referer=f"{BASE_URL}/checkout", transport_mode=transport_mode, user_agent=user_agent)
-
-    req_kwargs: dict = {
-        "url": api_url,
-        "headers": headers,
-        "json": payload,
-        "timeout": 30,
-    }
-    if proxy and transport_mode != "DIRECT":
-        req_kwargs["proxy"] = proxy
-
     try:
         resp = session.post(**req_kwargs)
-    except requests.errors.RequestsError as e:
-        raise VintedError("REQUEST_FAILED", str(e))
     except Exception as e:
-        msg = str(e)
-        if "cloudflare" in msg.lower() or "cf-" in msg.lower():
-            raise VintedError("CF_CHALLENGE", f"Cloudflare challenge: {msg}", None)
-        raise VintedError("UNKNOWN", msg)
+        raise _request_failure(e)
+    return _checkout_build_response(resp, proxy, transport_mode)
 
-    if resp.status_code == 401:
-        raise VintedError("SESSION_EXPIRED", "Session expired or invalid cookie", 401)
-    if resp.status_code == 403:
-        body = resp.text[:500]
-        raise VintedError("FORBIDDEN", f"Access forbidden (checkout/build): {body}", 403)
-    if resp.status_code == 429:
-        raise VintedError("RATE_LIMITED", "Too many requests", 429)
-    if resp.status_code not in (200, 201):
-        body = resp.text[:500]
-        if "already has a payment" in body:
-            raise VintedError("PAYMENT_IN_PROGRESS", "This item already has a payment in progress — it may be reserved by another buyer or a previous attempt.", resp.status_code)
-        raise VintedError(
-            "HTTP_ERROR",
-            f"HTTP {resp.status_code}: {body[:200]}",
-            resp.status_code,
-        )
 
-    _detect_challenge(resp, proxy, transport_mode)
+async def checkout_build_async(
+    order_id: int,
+    cookie: str,
+    csrf_token: str | None = None,
+    anon_id: str | None = None,
+    proxy: str | None = None,
+    transport_mode: str | None = None,
+    user_agent: str | None = None,
+) -> dict:
+    """Async variant of checkout_build() on the pooled AsyncSession."""
+    req_kwargs = _checkout_build_request(order_id, cookie, csrf_token, anon_id, transport_mode, user_agent)
+    session = _get_async_session(cookie, proxy, transport_mode)
     try:
-        return resp.json()
+        resp = await session.post(**req_kwargs)
     except Exception as e:
-        raise VintedError("PARSE_ERROR", f"Invalid JSON: {e}")
+        raise _request_failure(e)
+    return _checkout_build_response(resp, proxy, transport_mode)
+
+
+def _checkout_put_request(
+    purchase_id: str,
+    components: dict,
+    cookie: str,
+    csrf_token: str | None,
+    anon_id: str | None,
+    transport_mode: str | None,
+    user_agent: str | None,
+) -> dict:
+    return {
+        "url": f"{_PURCHASES_PREFIX}{purchase_id}/checkout",
+        "headers": _build_write_headers(cookie, csrf_token=csrf_token, anon_id=anon_id, transport_mode=transport_mode, user_agent=user_agent),
+        "data": _json_dumps({"components": components}),
+        "timeout": _CHECKOUT_TIMEOUT,
+    }
+
+
+def _checkout_put_response(resp, proxy: str | None, transport_mode: str | None) -> dict:
+    _raise_for_status(resp)
+    return _json_body(resp, proxy, transport_mode)
 
 
 def checkout_put(
@@ -499,54 +1058,18 @@ def checkout_put(
     """
     PUT checkout step: components (verification, pickup, payment, etc.)
     """
-    api_url = f"{BASE_URL}/api/v2/purchases/{purchase_id}/checkout"
-    payload = {"components": components}
-
+    req_kwargs = _checkout_put_request(purchase_id, components, cookie, csrf_token, anon_id, transport_mode, user_agent)
     session = _get_session(cookie, proxy, transport_mode)
-    headers = _build_write_headers(cookie, csrf_token=csrf_token, anon_id=anon_id, transport_mode=transport_mode, user_agent=user_agent)
-
-    req_kwargs: dict = {
-        "url": api_url,
-        "headers": headers,
-        "json": payload,
-        "timeout": 30,
-    }
-    if proxy and transport_mode != "DIRECT":
-        req_kwargs["proxy"] = proxy
-
     try:
         resp = session.put(**req_kwargs)
-    except requests.errors.RequestsError as e:
-        raise VintedError("REQUEST_FAILED", str(e))
-    except Exception as e:
-        msg = str(e)
-        if "cloudflare" in msg.lower():
-            raise VintedError("CF_CHALLENGE", f"Cloudflare challenge: {msg}", None)
-        raise VintedError("UNKNOWN", msg)
-
-    if resp.status_code == 401:
-        raise VintedError("SESSION_EXPIRED", "Session expired or invalid cookie", 401)
-    if resp.status_code == 403:
-        raise VintedError("FORBIDDEN", "Access forbidden", 403)
-    if resp.status_code == 429:
-        raise VintedError("RATE_LIMITED", "Too many requests", 429)
-    if resp.status_code != 200:
-        raise VintedError(
-            "HTTP_ERROR",
-            f"HTTP {resp.status_code}: {resp.text[:200]}",
-            resp.status_code,
-        )
-
-    _detect_challenge(resp, proxy, transport_mode)
-    try:
-        return resp.json()
     except Exception as e:
-        raise VintedError("PARSE_ERROR", f"Invalid JSON: {e}")
+        raise _request_failure(e)
+    return _checkout_put_response(resp, proxy, transport_mode)
 
 
-def checkout_pay(
+async def checkout_put_async(
     purchase_id: str,
-    checksum: str,
+    components: dict,
     cookie: str,
     csrf_token: str | None = None,
     anon_id: str | None = None,
@@ -554,12 +1077,25 @@ def checkout_pay(
     transport_mode: str | None = None,
     user_agent: str | None = None,
 ) -> dict:
-    """
-    Execute the final payment: POST /api/v2/purchases/{purchase_id}/checkout/payment
-    This actually charges the card and completes the purchase.
-    The checksum comes from the PUT checkout response.
-    """
-    api_url = f"{BASE_URL}/api/v2/purchases/{purchase_id}/checkout/payment"
+    """Async variant of checkout_put() on the pooled AsyncSession."""
+    req_kwargs = _checkout_put_request(purchase_id, components, cookie, csrf_token, anon_id, transport_mode, user_agent)
+    session = _get_async_session(cookie, proxy, transport_mode)
+    try:
+        resp = await session.put(**req_kwargs)
+    except Exception as e:
+        raise _request_failure(e)
+    return _checkout_put_response(resp, proxy, transport_mode)
+
+
+def _checkout_pay_request(
+    purchase_id: str,
+    checksum: str,
+    cookie: str,
+    csrf_token: str | None,
+    anon_id: str | None,
+    transport_mode: str | None,
+    user_agent: str | None,
+) -> dict:
     payload = {
         "checksum": checksum,
         "payment_options": {
@@ -573,29 +1109,15 @@ def checkout_pay(
             }
         },
     }
-
-    session = _get_session(cookie, proxy, transport_mode)
-    headers = _build_write_headers(cookie, csrf_token=csrf_token, anon_id=anon_id, transport_mode=transport_mode, user_agent=user_agent)
-
-    req_kwargs: dict = {
-        "url": api_url,
-        "headers": headers,
-        "json": payload,
+    return {
+        "url": f"{_PURCHASES_PREFIX}{purchase_id}/checkout/payment",
+        "headers": _build_write_headers(cookie, csrf_token=csrf_token, anon_id=anon_id, transport_mode=transport_mode, user_agent=user_agent),
+        "data": _json_dumps(payload),
         "timeout": 30,
     }
-    if proxy and transport_mode != "DIRECT":
-        req_kwargs["proxy"] = proxy
 
-    try:
-        resp = session.post(**req_kwargs)
-    except requests.errors.RequestsError as e:
-        raise VintedError("REQUEST_FAILED", str(e))
-    except Exception as e:
-        msg = str(e)
-        if "cloudflare" in msg.lower():
-            raise VintedError("CF_CHALLENGE", f"Cloudflare challenge: {msg}", None)
-        raise VintedError("UNKNOWN", msg)
 
+def _checkout_pay_response(resp, proxy: str | None, transport_mode: str | None) -> dict:
     if resp.status_code == 401:
         raise VintedError("SESSION_EXPIRED", "Session expired or invalid cookie", 401)
     if resp.status_code == 403:
@@ -614,11 +1136,115 @@ def checkout_pay(
 
     _detect_challenge(resp, proxy, transport_mode)
     try:
-        return resp.json()
-    except Exception as e:
+        return _json_loads(resp.content)
+    except ValueError as e:
         raise VintedError("PARSE_ERROR", f"Invalid JSON: {e}")
 
 
+def checkout_pay(
+    purchase_id: str,
+    checksum: str,
+    cookie: str,
+    csrf_token: str | None = None,
+    anon_id: str | None = None,
+    proxy: str | None = None,
+    transport_mode: str | None = None,
+    user_agent: str | None = None,
+) -> dict:
+    """
+    Execute the final payment: POST /api/v2/purchases/{purchase_id}/checkout/payment
+    This actually charges the card and completes the purchase.
+    The checksum comes from the PUT checkout response.
+    """
+    req_kwargs = _checkout_pay_request(purchase_id, checksum, cookie, csrf_token, anon_id, transport_mode, user_agent)
+    session = _get_session(cookie, proxy, transport_mode)
+    try:
+        resp = session.post(**req_kwargs)
+    except Exception as e:
+        raise _request_failure(e)
+    return _checkout_pay_response(resp, proxy, transport_mode)
+
+
+async def checkout_pay_async(
+    purchase_id: str,
+    checksum: str,
+    cookie: str,
+    csrf_token: str | None = None,
+    anon_id: str | None = None,
+    proxy: str | None = None,
+    transport_mode: str | None = None,
+    user_agent: str | None = None,
+) -> dict:
+    """Async variant of checkout_pay() on the pooled AsyncSession."""
+    req_kwargs = _checkout_pay_request(purchase_id, checksum, cookie, csrf_token, anon_id, transport_mode, user_agent)
+    session = _get_async_session(cookie, proxy, transport_mode)
+    try:
+        resp = await session.post(**req_kwargs)
+    except Exception as e:
+        raise _request_failure(e)
+    return _checkout_pay_response(resp, proxy, transport_mode)
+
+
+# Pickup points for a shipping order don't change within a checkout, and the
+# flow re-requests them with the same coordinates (and on retries). Successful
+# responses are kept briefly, keyed on order + rounded coordinates.
+_PICKUP_CACHE_MAX = 256
+_PICKUP_CACHE_TTL = 60.0
+# Entries hold the encoded response, so every hit decodes a fresh object and
+# a caller mutating its result can't corrupt the cache
+_pickup_cache: OrderedDict[tuple, tuple[float, bytes]] = OrderedDict()
+_pickup_cache_lock = threading.Lock()
+
+
+def _pickup_cache_key(shipping_order_id: int, latitude: float, longitude: float, country_code: str) -> tuple:
+    return (shipping_order_id, round(latitude, 4), round(longitude, 4), country_code)
+
+
+def _pickup_cache_get(key: tuple) -> dict | None:
+    with _pickup_cache_lock:
+        entry = _pickup_cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > _PICKUP_CACHE_TTL:
+            del _pickup_cache[key]
+            return None
+        _pickup_cache.move_to_end(key)
+        body = entry[1]
+    return _json_loads(body)
+
+
+def _pickup_cache_put(key: tuple, data: dict) -> None:
+    body = _json_dumps(data)
+    with _pickup_cache_lock:
+        _pickup_cache[key] = (time.monotonic(), body)
+        _pickup_cache.move_to_end(key)
+        if len(_pickup_cache) > _PICKUP_CACHE_MAX:
+            _pickup_cache.popitem(last=False)
+
+
+def _pickup_points_request(
+    shipping_order_id: int,
+    latitude: float,
+    longitude: float,
+    cookie: str,
+    country_code: str,
+    transport_mode: str | None,
+    user_agent: str | None,
+) -> dict:
+    api_url = f"{_SHIPPING_PREFIX}{shipping_order_id}/nearby_pickup_points"
+    qs = f"country_code={quote_plus(country_code)}&latitude={latitude}&longitude={longitude}"
+    return {
+        "url": f"{api_url}?{qs}",
+        "headers": _build_headers(cookie, transport_mode=transport_mode, user_agent=user_agent),
+        "timeout": _POLL_TIMEOUT,
+    }
+
+
+def _pickup_points_response(resp, proxy: str | None, transport_mode: str | None) -> dict:
+    _raise_for_status(resp)
+    return _json_body(resp, proxy, transport_mode)
+
+
 def nearby_pickup_points(
     shipping_order_id: int,
     latitude: float,
@@ -631,46 +1257,47 @@ def nearby_pickup_points(
 ) -> dict:
     """
     GET nearby pickup points for drop-off delivery.
+    Successful results are cached for a minute (see _pickup_cache).
     """
-    api_url = f"{BASE_URL}/api/v2/shipping_orders/{shipping_order_id}/nearby_pickup_points"
-    params = {
-        "country_code": country_code,
-        "latitude": latitude,
-        "longitude": longitude,
-    }
-    qs = urlencode(params)
-    full_url = f"{api_url}?{qs}"
-
+    cache_key = _pickup_cache_key(shipping_order_id, latitude, longitude, country_code)
+    cached = _pickup_cache_get(cache_key)
+    if cached is not None:
+        return cached
+    req_kwargs = _pickup_points_request(shipping_order_id, latitude, longitude, cookie, country_code, transport_mode, user_agent)
     session = _get_session(cookie, proxy, transport_mode)
-    req_kwargs: dict = {
-        "url": full_url,
-        "headers": _build_headers(cookie, transport_mode=transport_mode, user_agent=user_agent),
-        "timeout": 30,
-    }
-    if proxy and transport_mode != "DIRECT":
-        req_kwargs["proxy"] = proxy
-
     try:
         resp = session.get(**req_kwargs)
-    except requests.errors.RequestsError as e:
-        raise VintedError("REQUEST_FAILED", str(e))
     except Exception as e:
-        raise VintedError("UNKNOWN", str(e))
+        raise _request_failure(e)
+    data = _pickup_points_response(resp, proxy, transport_mode)
+    _pickup_cache_put(cache_key, data)
+    return data
 
-    if resp.status_code == 401:
-        raise VintedError("SESSION_EXPIRED", "Session expired", 401)
-    if resp.status_code != 200:
-        raise VintedError(
-            "HTTP_ERROR",
-            f"HTTP {resp.status_code}: {resp.text[:200]}",
-            resp.status_code,
-        )
 
-    _detect_challenge(resp, proxy, transport_mode)
+async def nearby_pickup_points_async(
+    shipping_order_id: int,
+    latitude: float,
+    longitude: float,
+    cookie: str,
+    proxy: str | None = None,
+    country_code: str = "GB",
+    transport_mode: str | None = None,
+    user_agent: str | None = None,
+) -> dict:
+    """Async variant of nearby_pickup_points() on the pooled AsyncSession."""
+    cache_key = _pickup_cache_key(shipping_order_id, latitude, longitude, country_code)
+    cached = _pickup_cache_get(cache_key)
+    if cached is not None:
+        return cached
+    req_kwargs = _pickup_points_request(shipping_order_id, latitude, longitude, cookie, country_code, transport_mode, user_agent)
+    session = _get_async_session(cookie, proxy, transport_mode)
     try:
-        return resp.json()
+        resp = await session.get(**req_kwargs)
     except Exception as e:
-        raise VintedError("PARSE_ERROR", f"Invalid JSON: {e}")
+        raise _request_failure(e)
+    data = _pickup_points_response(resp, proxy, transport_mode)
+    _pickup_cache_put(cache_key, data)
+    return data
 
 
 def apply_rate_limit(
@@ -678,8 +1305,16 @@ def apply_rate_limit(
     jitter_max_seconds: float = 1.0,
 ) -> None:
     """Apply per-request delay: base + random jitter. Configurable from Electron."""
-    delay = base_interval_seconds + random.uniform(0, jitter_max_seconds)
-    time.sleep(delay)
+    time.sleep(base_interval_seconds + random.random() * jitter_max_seconds)
+
+
+async def apply_rate_limit_async(
+    base_interval_seconds: float,
+    jitter_max_seconds: float = 1.0,
+) -> None:
+    """apply_rate_limit() for async callers: yields to the event loop instead
+    of blocking it, so concurrent polls keep progressing during the delay."""
+    await asyncio.sleep(base_interval_seconds + random.random() * jitter_max_seconds)
 
 
 # ─── Wardrobe & Inventory Management ────────────────────────────────────────
@@ -822,27 +1457,114 @@ def fetch_conversation_detail(
     if anon_id:
         headers["x-anon-id"] = anon_id
 
-    req_kwargs: dict = {"url": api_url, "headers": headers, "timeout": 30}
-    if proxy and transport_mode != "DIRECT":
-        req_kwargs["proxy"] = proxy
+    req_kwargs: dict = {"url": api_url, "headers": headers, "timeout": 30}
+    if proxy and transport_mode != "DIRECT":
+        req_kwargs["proxy"] = proxy
+
+    try:
+        resp = session.get(**req_kwargs)
+    except requests.errors.RequestsError as e:
+        raise VintedError("REQUEST_FAILED", str(e))
+    except Exception as e:
+        raise VintedError("UNKNOWN", str(e))
+
+    return _handle_response(resp, allow_statuses=(200, 304), proxy=proxy)
+
+
+# ─── Ontology Endpoints ─────────────────────────────────────────────────────
+
+
+def _fetch_ontology(
+    api_url: str,
+    cookie: str,
+    proxy: str | None = None,
+    transport_mode: str | None = None,
+    user_agent: str | None = None,
+    allow_statuses: tuple = (200, 304),
+    empty_on_404: dict | None = None,
+) -> dict:
+    """Shared GET for the read-only item_upload lookups.
+    Concurrent identical requests (e.g. the listing editor loading its
+    brand/size/condition pickers at once) share one upstream call. Only
+    requests sent as the same account and browser are identical, so cookie
+    and User-Agent are part of the key; each caller gets its own copy."""
+
+    def _do_fetch() -> dict:
+        # The proxy is bound on the pooled session
+        session = _get_session(cookie, proxy, transport_mode)
+        try:
+            resp = session.get(**_ontology_request(api_url, cookie, transport_mode, user_agent))
+        except requests.errors.RequestsError as e:
+            raise VintedError("REQUEST_FAILED", str(e))
+        except Exception as e:
+            raise VintedError("UNKNOWN", str(e))
+        return _ontology_response(resp, proxy, allow_statuses, empty_on_404)
+
+    key = (api_url, proxy, transport_mode, cookie, user_agent)
+    return dict(_single_flight(key, _do_fetch))
+
+
+def _ontology_request(
+    api_url: str,
+    cookie: str,
+    transport_mode: str | None,
+    user_agent: str | None,
+) -> dict:
+    headers = _build_headers(cookie, f"{BASE_URL}/items/new", transport_mode, user_agent=user_agent)
+    return {"url": api_url, "headers": headers, "timeout": 30}
+
+
+def _ontology_response(
+    resp,
+    proxy: str | None,
+    allow_statuses: tuple = (200, 304),
+    empty_on_404: dict | None = None,
+) -> dict:
+    # Some lookups legitimately 404 (e.g. categories with no sizes) and the
+    # body may be HTML, so return the empty shape without parsing it.
+    if empty_on_404 is not None and resp.status_code == 404:
+        return dict(empty_on_404)
+    return _handle_response(resp, allow_statuses=allow_statuses, proxy=proxy)
 
-    try:
-        resp = session.get(**req_kwargs)
-    except requests.errors.RequestsError as e:
-        raise VintedError("REQUEST_FAILED", str(e))
-    except Exception as e:
-        raise VintedError("UNKNOWN", str(e))
 
-    return _handle_response(resp, allow_statuses=(200, 304), proxy=proxy)
+async def fetch_ontology_bundle(
+    cookie: str,
+    catalog_id: int | None = None,
+    proxy: str | None = None,
+    transport_mode: str | None = None,
+    user_agent: str | None = None,
+) -> dict:
+    """Fetch the listing-form lookups (categories, colors, brands and, given a
+    catalog_id, conditions) concurrently as streams on one pooled AsyncSession,
+    so warming them costs about one round trip instead of four.
+    Returns {"categories", "colors", "brands"[, "conditions"]}; any failure
+    fails the bundle."""
+    urls = {
+        "categories": f"{BASE_URL}/api/v2/item_upload/catalogs",
+        "colors": f"{BASE_URL}/api/v2/item_upload/colors",
+        "brands": f"{BASE_URL}/api/v2/item_upload/brands",
+    }
+    if catalog_id is not None:
+        urls["brands"] += f"?{urlencode({'category_id': catalog_id})}"
+        urls["conditions"] = f"{BASE_URL}/api/v2/item_upload/conditions?{urlencode({'catalog_id': catalog_id})}"
 
+    session = _get_async_session(cookie, proxy, transport_mode)
 
-# ─── Ontology Endpoints ─────────────────────────────────────────────────────
+    async def _get(api_url: str) -> dict:
+        try:
+            resp = await session.get(**_ontology_request(api_url, cookie, transport_mode, user_agent))
+        except requests.errors.RequestsError as e:
+            raise VintedError("REQUEST_FAILED", str(e))
+        except Exception as e:
+            raise VintedError("UNKNOWN", str(e))
+        return _ontology_response(resp, proxy)
+
+    results = await asyncio.gather(*(_get(u) for u in urls.values()))
+    return dict(zip(urls, results))
 
 
 def fetch_ontology_categories(
     cookie: str,
-    csrf_token: str | None = None,
-    anon_id: str | None = None,
     proxy: str | None = None,
     transport_mode: str | None = None,
     user_agent: str | None = None,
@@ -850,33 +1572,13 @@ def fetch_ontology_categories(
     """GET /api/v2/item_upload/catalogs — fetch full category tree."""
     api_url = f"{BASE_URL}/api/v2/item_upload/catalogs"
 
-    session = _get_session(cookie, proxy, transport_mode)
-    headers = _build_headers(cookie, f"{BASE_URL}/items/new", transport_mode, user_agent=user_agent)
-    if csrf_token:
-        headers["x-csrf-token"] = csrf_token
-    if anon_id:
-        headers["x-anon-id"] = anon_id
-
-    req_kwargs: dict = {"url": api_url, "headers": headers, "timeout": 30}
-    if proxy and transport_mode != "DIRECT":
-        req_kwargs["proxy"] = proxy
-
-    try:
-        resp = session.get(**req_kwargs)
-    except requests.errors.RequestsError as e:
-        raise VintedError("REQUEST_FAILED", str(e))
-    except Exception as e:
-        raise VintedError("UNKNOWN", str(e))
-
-    return _handle_response(resp, allow_statuses=(200, 304), proxy=proxy)
+    return _fetch_ontology(api_url, cookie, proxy, transport_mode, user_agent)
 
 
 def fetch_ontology_brands(
     cookie: str,
     category_id: int | None = None,
     keyword: str | None = None,
-    csrf_token: str | None = None,
-    anon_id: str | None = None,
     proxy: str | None = None,
     transport_mode: str | None = None,
     user_agent: str | None = None,
@@ -892,31 +1594,11 @@ def fetch_ontology_brands(
     if qs:
         api_url += f"?{qs}"
 
-    session = _get_session(cookie, proxy, transport_mode)
-    headers = _build_headers(cookie, f"{BASE_URL}/items/new", transport_mode, user_agent=user_agent)
-    if csrf_token:
-        headers["x-csrf-token"] = csrf_token
-    if anon_id:
-        headers["x-anon-id"] = anon_id
-
-    req_kwargs: dict = {"url": api_url, "headers": headers, "timeout": 30}
-    if proxy and transport_mode != "DIRECT":
-        req_kwargs["proxy"] = proxy
-
-    try:
-        resp = session.get(**req_kwargs)
-    except requests.errors.RequestsError as e:
-        raise VintedError("REQUEST_FAILED", str(e))
-    except Exception as e:
-        raise VintedError("UNKNOWN", str(e))
-
-    return _handle_response(resp, allow_statuses=(200, 304), proxy=proxy)
+    return _fetch_ontology(api_url, cookie, proxy, transport_mode, user_agent)
 
 
 def fetch_ontology_colors(
     cookie: str,
-    csrf_token: str | None = None,
-    anon_id: str | None = None,
     proxy: str | None = None,
     transport_mode: str | None = None,
     user_agent: str | None = None,
@@ -924,32 +1606,12 @@ def fetch_ontology_colors(
     """GET /api/v2/item_upload/colors — fetch all color options."""
     api_url = f"{BASE_URL}/api/v2/item_upload/colors"
 
-    session = _get_session(cookie, proxy, transport_mode)
-    headers = _build_headers(cookie, f"{BASE_URL}/items/new", transport_mode, user_agent=user_agent)
-    if csrf_token:
-        headers["x-csrf-token"] = csrf_token
-    if anon_id:
-        headers["x-anon-id"] = anon_id
-
-    req_kwargs: dict = {"url": api_url, "headers": headers, "timeout": 30}
-    if proxy and transport_mode != "DIRECT":
-        req_kwargs["proxy"] = proxy
-
-    try:
-        resp = session.get(**req_kwargs)
-    except requests.errors.RequestsError as e:
-        raise VintedError("REQUEST_FAILED", str(e))
-    except Exception as e:
-        raise VintedError("UNKNOWN", str(e))
-
-    return _handle_response(resp, allow_statuses=(200, 304), proxy=proxy)
+    return _fetch_ontology(api_url, cookie, proxy, transport_mode, user_agent)
 
 
 def fetch_ontology_conditions(
     cookie: str,
     catalog_id: int,
-    csrf_token: str | None = None,
-    anon_id: str | None = None,
     proxy: str | None = None,
     transport_mode: str | None = None,
     user_agent: str | None = None,
@@ -958,33 +1620,13 @@ def fetch_ontology_conditions(
     qs = urlencode({"catalog_id": catalog_id})
     api_url = f"{BASE_URL}/api/v2/item_upload/conditions?{qs}"
 
-    session = _get_session(cookie, proxy, transport_mode)
-    headers = _build_headers(cookie, f"{BASE_URL}/items/new", transport_mode, user_agent=user_agent)
-    if csrf_token:
-        headers["x-csrf-token"] = csrf_token
-    if anon_id:
-        headers["x-anon-id"] = anon_id
-
-    req_kwargs: dict = {"url": api_url, "headers": headers, "timeout": 30}
-    if proxy and transport_mode != "DIRECT":
-        req_kwargs["proxy"] = proxy
-
-    try:
-        resp = session.get(**req_kwargs)
-    except requests.errors.RequestsError as e:
-        raise VintedError("REQUEST_FAILED", str(e))
-    except Exception as e:
-        raise VintedError("UNKNOWN", str(e))
-
-    return _handle_response(resp, allow_statuses=(200, 304), proxy=proxy)
+    return _fetch_ontology(api_url, cookie, proxy, transport_mode, user_agent)
 
 
 def fetch_ontology_models(
     cookie: str,
     catalog_id: int,
     brand_id: int,
-    csrf_token: str | None = None,
-    anon_id: str | None = None,
     proxy: str | None = None,
     transport_mode: str | None = None,
     user_agent: str | None = None,
@@ -993,32 +1635,12 @@ def fetch_ontology_models(
     qs = urlencode({"catalog_id": catalog_id, "brand_id": brand_id})
     api_url = f"{BASE_URL}/api/v2/item_upload/models?{qs}"
 
-    session = _get_session(cookie, proxy, transport_mode)
-    headers = _build_headers(cookie, f"{BASE_URL}/items/new", transport_mode, user_agent=user_agent)
-    if csrf_token:
-        headers["x-csrf-token"] = csrf_token
-    if anon_id:
-        headers["x-anon-id"] = anon_id
-
-    req_kwargs: dict = {"url": api_url, "headers": headers, "timeout": 30}
-    if proxy and transport_mode != "DIRECT":
-        req_kwargs["proxy"] = proxy
-
-    try:
-        resp = session.get(**req_kwargs)
-    except requests.errors.RequestsError as e:
-        raise VintedError("REQUEST_FAILED", str(e))
-    except Exception as e:
-        raise VintedError("UNKNOWN", str(e))
-
-    return _handle_response(resp, allow_statuses=(200, 304, 404), proxy=proxy)
+    return _fetch_ontology(api_url, cookie, proxy, transport_mode, user_agent, allow_statuses=(200, 304, 404))
 
 
 def fetch_ontology_sizes(
     cookie: str,
     catalog_id: int,
-    csrf_token: str | None = None,
-    anon_id: str | None = None,
     proxy: str | None = None,
     transport_mode: str | None = None,
     user_agent: str | None = None,
@@ -1027,31 +1649,7 @@ def fetch_ontology_sizes(
     qs = urlencode({"catalog_ids": catalog_id})
     api_url = f"{BASE_URL}/api/v2/item_upload/size_groups?{qs}"
 
-    session = _get_session(cookie, proxy, transport_mode)
-    headers = _build_headers(cookie, f"{BASE_URL}/items/new", transport_mode, user_agent=user_agent)
-    if csrf_token:
-        headers["x-csrf-token"] = csrf_token
-    if anon_id:
-        headers["x-anon-id"] = anon_id
-
-    req_kwargs: dict = {"url": api_url, "headers": headers, "timeout": 30}
-    if proxy and transport_mode != "DIRECT":
-        req_kwargs["proxy"] = proxy
-
-    try:
-        resp = session.get(**req_kwargs)
-    except requests.errors.RequestsError as e:
-        raise VintedError("REQUEST_FAILED", str(e))
-    except Exception as e:
-        raise VintedError("UNKNOWN", str(e))
-
-    # Vinted returns 404 for categories that simply have no sizes (e.g. bags).
-    # Treat that as a valid "no size groups" response rather than an error.
-    # Some 404 responses may be HTML (not JSON), so don't call resp.json().
-    if resp.status_code == 404:
-        return {"size_groups": []}
-
-    return _handle_response(resp, allow_statuses=(200, 304, 404), proxy=proxy)
+    return _fetch_ontology(api_url, cookie, proxy, transport_mode, user_agent, empty_on_404={"size_groups": []})
 
 
 def fetch_ontology_materials(
@@ -1085,7 +1683,7 @@ def fetch_ontology_materials(
     if anon_id:
         headers["x-anon-id"] = anon_id
 
-    req_kwargs: dict = {"url": api_url, "headers": headers, "json": payload, "timeout": 30}
+    req_kwargs: dict = {"url": api_url, "headers": headers, "data": _json_dumps(payload), "timeout": 30}
     if proxy and transport_mode != "DIRECT":
         req_kwargs["proxy"] = proxy
 
@@ -1103,8 +1701,6 @@ def fetch_ontology_package_sizes(
     cookie: str,
     catalog_id: int,
     item_id: int | None = None,
-    csrf_token: str | None = None,
-    anon_id: str | None = None,
     proxy: str | None = None,
     transport_mode: str | None = None,
     user_agent: str | None = None,
@@ -1114,25 +1710,7 @@ def fetch_ontology_package_sizes(
     if item_id:
         api_url += f"?item_id={item_id}"
 
-    session = _get_session(cookie, proxy, transport_mode)
-    headers = _build_headers(cookie, f"{BASE_URL}/items/new", transport_mode, user_agent=user_agent)
-    if csrf_token:
-        headers["x-csrf-token"] = csrf_token
-    if anon_id:
-        headers["x-anon-id"] = anon_id
-
-    req_kwargs: dict = {"url": api_url, "headers": headers, "timeout": 30}
-    if proxy and transport_mode != "DIRECT":
-        req_kwargs["proxy"] = proxy
-
-    try:
-        resp = session.get(**req_kwargs)
-    except requests.errors.RequestsError as e:
-        raise VintedError("REQUEST_FAILED", str(e))
-    except Exception as e:
-        raise VintedError("UNKNOWN", str(e))
-
-    return _handle_response(resp, allow_statuses=(200, 304), proxy=proxy)
+    return _fetch_ontology(api_url, cookie, proxy, transport_mode, user_agent)
 
 
 def _fetch_page_html(
@@ -1180,13 +1758,13 @@ def _fetch_page_html(
     if resp.status_code not in (200,):
         raise VintedError("HTTP_ERROR", f"HTTP {resp.status_code}", resp.status_code)
 
-    html = resp.text
-    body_lower = html[:2000].lower()
-    if "datadome" in body_lower and "captcha" in body_lower:
+    head = resp.content[:2000]
+    if _DATADOME_RE.search(head) and _CAPTCHA_RE.search(head):
         reset_session(proxy, transport_mode)
+        _note_cf_challenge()
         raise VintedError("DATADOME_CHALLENGE", "Bot challenge detected", 403)
 
-    return html
+    return resp.text
 
 
 def fetch_item_detail(
@@ -1222,10 +1800,7 @@ def fetch_item_detail(
         edit_regex = _extract_fields_regex(edit_html, item_id)
 
         # Log __NUXT_DATA__ diagnostics for edit page
-        nuxt_raw = re.findall(
-            r'<script[^>]*(?:id=["\']?__NUXT_DATA__["\']?|data-nuxt-data)[^>]*>(.*?)</script>',
-            edit_html, re.DOTALL | re.IGNORECASE,
-        )
+        nuxt_raw = _NUXT_DATA_RE.findall(edit_html)
         debug_info["edit_page"] = {
             "html_len": len(edit_html),
             "nuxt_tags": len(nuxt_raw),
@@ -1253,10 +1828,7 @@ def fetch_item_detail(
             view_item = _extract_item_from_html(view_html, item_id)
             view_regex = _extract_fields_regex(view_html, item_id)
 
-            nuxt_raw = re.findall(
-                r'<script[^>]*(?:id=["\']?__NUXT_DATA__["\']?|data-nuxt-data)[^>]*>(.*?)</script>',
-                view_html, re.DOTALL | re.IGNORECASE,
-            )
+            nuxt_raw = _NUXT_DATA_RE.findall(view_html)
             debug_info["view_page"] = {
                 "html_len": len(view_html),
                 "nuxt_tags": len(nuxt_raw),
@@ -1313,6 +1885,96 @@ def fetch_item_detail(
 # ─── SSR Data Normalisation ──────────────────────────────────────────────────
 
 
+# Opt-in diagnostics: dump raw SSR keys on every normalisation
+_DEBUG_SSR = bool(os.environ.get("VINTED_DEBUG_SSR"))
+
+# Scalar fields copied through unchanged
+_SSR_SCALAR_KEYS = frozenset({
+    "id", "title", "description", "is_unisex", "isbn",
+    "measurement_length", "measurement_width",
+    "manufacturer", "manufacturer_labelling",
+    "video_game_rating_id", "model_metadata",
+    "is_hidden", "is_closed", "is_reserved", "is_draft",
+})
+
+# SSR/camelCase spelling -> (canonical key, precedence, last in chain).
+# Resolution matches a `raw.get(a) or raw.get(b) or ...` chain: the truthy
+# spelling with the lowest precedence wins, and when none is truthy the
+# result is whatever the last spelling holds (so `{"brandId": 0}` yields 0,
+# but `{"brand_id": 0}` alone yields nothing).
+_SSR_ALIAS: dict[str, tuple[str, int, bool]] = {
+    "catalog_id": ("catalog_id", 0, False),
+    "category_id": ("catalog_id", 1, False),
+    "catalogId": ("catalog_id", 2, False),
+    "categoryId": ("catalog_id", 3, True),
+    "brand_id": ("brand_id", 0, False),
+    "brandId": ("brand_id", 1, True),
+    "brand_title": ("brand_title", 0, False),
+    "brandTitle": ("brand_title", 1, True),
+    "size_id": ("size_id", 0, False),
+    "sizeId": ("size_id", 1, True),
+    "size_title": ("size_title", 0, True),
+    "status_id": ("status_id", 0, False),
+    "statusId": ("status_id", 1, True),
+    "package_size_id": ("package_size_id", 0, False),
+    "packageSizeId": ("package_size_id", 1, True),
+    "item_attributes": ("item_attributes", 0, False),
+    "itemAttributes": ("item_attributes", 1, False),
+    "attributes": ("item_attributes", 2, True),
+    "shipment_prices": ("shipment_prices", 0, False),
+    "shipmentPrices": ("shipment_prices", 1, True),
+}
+
+# Condition label -> Vinted status_id, for payloads that only carry the label
+_SSR_COND_MAP: dict[str, int] = {
+    "New with tags": 6, "new_with_tags": 6,
+    "New without tags": 1, "new_without_tags": 1,
+    "Very good": 2, "very_good": 2,
+    "Good": 3, "good": 3,
+    "Satisfactory": 4, "satisfactory": 4,
+    "Not fully functional": 5,
+}
+
+# Short label values worth interning in the normalized output
+_SSR_INTERN_KEYS = ("currency", "brand_title", "size_title")
+
+# Keys whose values need unpacking after the main pass
+_SSR_NESTED_KEYS = frozenset({
+    "price", "category", "catalog", "catalogue", "brand_dto", "brand",
+    "size", "status", "package_size", "photos",
+})
+
+# Every key that can carry an item's colours; collected in the main pass and
+# only resolved when at least one is present
+_SSR_COLOR_KEYS = frozenset({
+    "color_ids", "colorIds", "colors",
+    "color1_id", "color1Id", "color2_id", "color2Id",
+})
+
+
+def _ssr_color_ids(src: dict) -> list | None:
+    """Resolve color_ids from the colour keys seen in an SSR item.
+    Precedence: a color_ids/colorIds list, then a colors array, then the
+    color1/color2 pair."""
+    cids = src.get("color_ids") or src.get("colorIds")
+    if isinstance(cids, list):
+        return cids
+    colors_arr = src.get("colors")
+    if isinstance(colors_arr, list):
+        return [
+            c.get("id") if isinstance(c, dict) else c
+            for c in colors_arr
+            if (c.get("id") if isinstance(c, dict) else c) is not None
+        ]
+    ids = [
+        c for c in (
+            src.get("color1_id") or src.get("color1Id"),
+            src.get("color2_id") or src.get("color2Id"),
+        ) if c
+    ]
+    return ids or None
+
+
 def _normalize_ssr_item(raw: dict) -> dict:
     """Normalize Vinted SSR/Nuxt item data to canonical API field names.
 
@@ -1322,132 +1984,115 @@ def _normalize_ssr_item(raw: dict) -> dict:
     a consistent shape: {catalog_id, brand_id, brand_title, size_id, status_id,
     color_ids, package_size_id, price, ...}.
 
-    Also logs the raw SSR key set for diagnostics (visible in the Python bridge
-    console) so field-name mismatches can be diagnosed.
+    Set VINTED_DEBUG_SSR=1 to log the raw SSR key set to stderr (visible in
+    the Python bridge console) so field-name mismatches can be diagnosed.
     """
-    out: dict = {}
+    if _DEBUG_SSR:
+        print(f"[normalize_ssr_item] raw keys ({len(raw)}): {sorted(raw)}", file=sys.stderr)
 
-    # ── Pass-through simple scalar fields ────────────────────────────────
-    for key in (
-        "id", "title", "description", "is_unisex", "isbn",
-        "measurement_length", "measurement_width",
-        "manufacturer", "manufacturer_labelling",
-        "video_game_rating_id", "model_metadata",
-    ):
-        if key in raw and raw[key] is not None:
-            out[key] = raw[key]
+    out: dict = {}
+    nested: dict = {}
+    ranked: dict[str, tuple[int, object]] = {}
+    fallback: dict = {}
+    color_acc: dict = {}
+
+    # ── Single pass: route each key to pass-through, alias or nested ─────
+    for k, v in raw.items():
+        if v is None:
+            continue
+        if k in _SSR_SCALAR_KEYS:
+            out[k] = v
+        elif k in _SSR_ALIAS:
+            canon, rank, last = _SSR_ALIAS[k]
+            if v:
+                cur = ranked.get(canon)
+                if cur is None or rank < cur[0]:
+                    ranked[canon] = (rank, v)
+            elif last:
+                # Falsy tail of the chain: only used when no spelling is truthy
+                fallback[canon] = v
+        elif k in _SSR_NESTED_KEYS:
+            nested[k] = v
+        elif k in _SSR_COLOR_KEYS:
+            color_acc[k] = v
+
+    for canon, (_, v) in ranked.items():
+        out[canon] = v
+    for canon, v in fallback.items():
+        if canon not in out:
+            out[canon] = v
 
     # ── Price — number, string, or {amount, currency_code} ───────────────
-    price_raw = raw.get("price")
+    price_raw = nested.get("price")
     if isinstance(price_raw, dict):
         out["price"] = price_raw.get("amount", price_raw.get("price"))
         out["currency"] = price_raw.get("currency_code", "GBP")
     elif price_raw is not None:
         out["price"] = price_raw
 
-    # ── catalog_id (category) ────────────────────────────────────────────
-    out["catalog_id"] = (
-        raw.get("catalog_id")
-        or raw.get("category_id")
-        or raw.get("catalogId")
-        or raw.get("categoryId")
-    )
+    # ── catalog_id from nested category object ───────────────────────────
     for nested_key in ("category", "catalog", "catalogue"):
-        obj = raw.get(nested_key)
+        obj = nested.get(nested_key)
         if isinstance(obj, dict) and not out.get("catalog_id"):
             out["catalog_id"] = obj.get("id")
 
-    # ── brand_id / brand_title ───────────────────────────────────────────
-    out["brand_id"] = raw.get("brand_id") or raw.get("brandId")
+    # ── brand_id / brand_title from nested brand object ──────────────────
     brand_title = None
     for bkey in ("brand_dto", "brand"):
-        bval = raw.get(bkey)
+        bval = nested.get(bkey)
         if isinstance(bval, dict):
             if not out.get("brand_id"):
                 out["brand_id"] = bval.get("id")
             brand_title = bval.get("title") or bval.get("name") or brand_title
         elif isinstance(bval, str) and bval:
             brand_title = bval
-    out["brand_title"] = brand_title or raw.get("brand_title") or raw.get("brandTitle")
+    if brand_title:
+        out["brand_title"] = brand_title
 
-    # ── size_id ──────────────────────────────────────────────────────────
-    out["size_id"] = raw.get("size_id") or raw.get("sizeId")
-    size_val = raw.get("size")
+    # ── size_id / size_title ─────────────────────────────────────────────
+    size_val = nested.get("size")
     if isinstance(size_val, dict) and not out.get("size_id"):
         out["size_id"] = size_val.get("id")
     out["size_title"] = (
-        raw.get("size_title")
+        out.get("size_title")
         or (size_val.get("title") if isinstance(size_val, dict) else None)
         or (size_val if isinstance(size_val, str) else None)
     )
 
     # ── status_id (condition) ────────────────────────────────────────────
-    out["status_id"] = raw.get("status_id") or raw.get("statusId")
-    status_val = raw.get("status")
+    status_val = nested.get("status")
     if isinstance(status_val, dict) and not out.get("status_id"):
         out["status_id"] = status_val.get("id")
     elif isinstance(status_val, str) and not out.get("status_id"):
-        _cond_map = {
-            "New with tags": 6, "new_with_tags": 6,
-            "New without tags": 1, "new_without_tags": 1,
-            "Very good": 2, "very_good": 2,
-            "Good": 3, "good": 3,
-            "Satisfactory": 4, "satisfactory": 4,
-            "Not fully functional": 5,
-        }
-        out["status_id"] = _cond_map.get(status_val)
+        out["status_id"] = _SSR_COND_MAP.get(status_val)
 
     # ── package_size_id ──────────────────────────────────────────────────
-    out["package_size_id"] = raw.get("package_size_id") or raw.get("packageSizeId")
-    pkg_val = raw.get("package_size")
+    pkg_val = nested.get("package_size")
     if isinstance(pkg_val, dict) and not out.get("package_size_id"):
         out["package_size_id"] = pkg_val.get("id")
 
     # ── color_ids ────────────────────────────────────────────────────────
-    cids = raw.get("color_ids") or raw.get("colorIds")
-    if isinstance(cids, list):
-        out["color_ids"] = cids
-    else:
-        colors_arr = raw.get("colors")
-        if isinstance(colors_arr, list):
-            out["color_ids"] = [
-                c.get("id") if isinstance(c, dict) else c
-                for c in colors_arr
-                if (c.get("id") if isinstance(c, dict) else c) is not None
-            ]
-        else:
-            ids = []
-            c1 = raw.get("color1_id") or raw.get("color1Id")
-            c2 = raw.get("color2_id") or raw.get("color2Id")
-            if c1:
-                ids.append(c1)
-            if c2:
-                ids.append(c2)
-            if ids:
-                out["color_ids"] = ids
-
-    # ── item_attributes (materials, etc.) ────────────────────────────────
-    attrs = raw.get("item_attributes") or raw.get("itemAttributes") or raw.get("attributes")
-    if attrs is not None:
-        out["item_attributes"] = attrs
-
-    # ── shipment_prices ──────────────────────────────────────────────────
-    sp = raw.get("shipment_prices") or raw.get("shipmentPrices")
-    if sp is not None:
-        out["shipment_prices"] = sp
-
-    # ── is_hidden / is_closed / is_reserved / is_draft flags ─────────────
-    for flag in ("is_hidden", "is_closed", "is_reserved", "is_draft"):
-        if flag in raw:
-            out[flag] = raw[flag]
+    if color_acc:
+        color_ids = _ssr_color_ids(color_acc)
+        if color_ids is not None:
+            out["color_ids"] = color_ids
 
     # ── photos (preserve for downstream) ─────────────────────────────────
-    photos = raw.get("photos")
+    photos = nested.get("photos")
     if isinstance(photos, list):
         out["photos"] = photos
 
-    # Strip None values to keep the output clean
-    return {k: v for k, v in out.items() if v is not None}
+    # Nested lookups above may have assigned None; drop those
+    out = {k: v for k, v in out.items() if v is not None}
+
+    # Currency codes and brand/size titles repeat across thousands of items;
+    # share one str object per distinct short label.
+    for key in _SSR_INTERN_KEYS:
+        val = out.get(key)
+        if isinstance(val, str) and len(val) < 40:
+            out[key] = sys.intern(val)
+
+    return out
 
 
 # ─── Regex-based Field Extraction ─────────────────────────────────────────────
@@ -1543,24 +2188,46 @@ def _extract_fields_regex(html: str, item_id: int) -> dict:
 # ─── Nuxt SSR Data Extraction ────────────────────────────────────────────────
 
 
+# Parsed items keyed by (item_id, crc32 of page HTML). Retries that re-fetch an
+# unchanged page skip the Nuxt resolve entirely. Bounded LRU.
+_ITEM_PARSE_CACHE_MAX = 64
+_item_parse_cache: OrderedDict[tuple[int, int], dict | None] = OrderedDict()
+_item_parse_lock = threading.Lock()
+
+
 def _extract_item_from_html(html: str, item_id: int) -> dict | None:
+    """Extract item data from Vinted page HTML, reusing the result when the
+    same page for the same item has already been parsed."""
+    data = html.encode() if isinstance(html, str) else html
+    key = (item_id, zlib.crc32(data))
+    with _item_parse_lock:
+        if key in _item_parse_cache:
+            _item_parse_cache.move_to_end(key)
+            return _item_parse_cache[key]
+
+    item = _parse_item_from_html(html, item_id)
+
+    with _item_parse_lock:
+        _item_parse_cache[key] = item
+        _item_parse_cache.move_to_end(key)
+        while len(_item_parse_cache) > _ITEM_PARSE_CACHE_MAX:
+            _item_parse_cache.popitem(last=False)
+    return item
+
+
+def _parse_item_from_html(html: str, item_id: int) -> dict | None:
     """Extract item data from Vinted page HTML.
     Tries multiple strategies: Nuxt __NUXT_DATA__, window.__NUXT__,
     Schema.org JSON-LD, and raw JSON blobs."""
 
     # ── Strategy 1a: Nuxt 3 __NUXT_DATA__ script tags ──
     # Match various attribute orderings and quote styles
-    nuxt_matches = re.findall(
-        r'<script[^>]*(?:id=["\']?__NUXT_DATA__["\']?|data-nuxt-data)[^>]*>(.*?)</script>',
-        html,
-        re.DOTALL | re.IGNORECASE,
-    )
-
     best_item: dict | None = None
     best_key_count = 0
 
-    for raw in nuxt_matches:
-        stripped = raw.strip()
+    # Every tag is considered (the richest match wins), but iterate lazily
+    for m in _NUXT_DATA_RE.finditer(html):
+        stripped = m.group(1).strip()
 
         # Try standard Nuxt 3 format (["Reactive", 1] or ["ShallowReactive", 1])
         data = _parse_nuxt_payload(stripped)
@@ -1575,7 +2242,7 @@ def _extract_item_from_html(html: str, item_id: int) -> dict | None:
         # Try as raw JSON (some Nuxt builds emit plain JSON, not compressed)
         if not data:
             try:
-                data = json.loads(stripped)
+                data = _json_loads(stripped)
                 if isinstance(data, dict):
                     item = _find_item_in_data(data, item_id)
                     if item and isinstance(item, dict) and len(item) > best_key_count:
@@ -1588,14 +2255,10 @@ def _extract_item_from_html(html: str, item_id: int) -> dict | None:
         return best_item
 
     # Strategy 2: Schema.org JSON-LD
-    ld_matches = re.findall(
-        r'<script[^>]*type="application/ld\+json"[^>]*>(.*?)</script>',
-        html,
-        re.DOTALL,
-    )
-    for raw in ld_matches:
+    # First Product wins, so stop scanning at the first usable block
+    for m in _LD_JSON_RE.finditer(html):
         try:
-            ld = json.loads(raw.strip())
+            ld = _json_loads(m.group(1).strip())
             items = ld if isinstance(ld, list) else [ld]
             for entry in items:
                 if isinstance(entry, dict) and entry.get("@type") == "Product":
@@ -1604,14 +2267,10 @@ def _extract_item_from_html(html: str, item_id: int) -> dict | None:
             pass
 
     # Strategy 3: window.__NUXT__ (older Nuxt 2 format)
-    nuxt2_match = re.search(
-        r"window\.__NUXT__\s*=\s*(\{.+?\})\s*;?\s*</script>",
-        html,
-        re.DOTALL,
-    )
+    nuxt2_match = _NUXT2_RE.search(html)
     if nuxt2_match:
         try:
-            data = json.loads(nuxt2_match.group(1))
+            data = _json_loads(nuxt2_match.group(1))
             item = _find_item_in_data(data, item_id)
             if item:
                 return item
@@ -1624,7 +2283,7 @@ def _extract_item_from_html(html: str, item_id: int) -> dict | None:
 def _parse_nuxt_payload(raw_json: str) -> dict | None:
     """Parse Nuxt 3 __NUXT_DATA__ compressed array format into a dict."""
     try:
-        arr = json.loads(raw_json)
+        arr = _json_loads(raw_json)
     except (json.JSONDecodeError, ValueError):
         return None
 
@@ -1637,74 +2296,113 @@ def _parse_nuxt_payload(raw_json: str) -> dict | None:
     if header[0] not in ("Reactive", "ShallowReactive"):
         return None
 
-    return _resolve_nuxt_node(arr, 1, depth=0)
+    try:
+        return _resolve_nuxt_node(arr, 1, {})
+    except RecursionError:
+        return None
+
+
+# Marks a node whose value is still being built; re-entering it means the
+# payload references itself
+_NUXT_IN_PROGRESS = object()
 
 
-def _resolve_nuxt_node(arr: list, idx: int, depth: int = 0) -> object:
-    """Recursively resolve a Nuxt compressed-array reference."""
-    if depth > 40 or idx < 0 or idx >= len(arr):
+def _resolve_nuxt_node(arr: list, idx: int, memo: dict) -> object:
+    """Resolve a Nuxt compressed-array reference.
+
+    The array is a DAG: shared objects (brand, catalog, ...) are referenced
+    from several parents. memo maps idx -> resolved value so each node is
+    expanded once. A node is marked in progress while it is being built and
+    a reference back into it resolves to None, so a self-referencing
+    payload still yields an acyclic (JSON-serialisable) result.
+    """
+    if idx < 0 or idx >= len(arr):
         return None
 
     node = arr[idx]
 
-    if isinstance(node, dict):
+    # Leaves (string, number, bool, null) dominate real payloads; exact type
+    # identity checks are cheaper than isinstance and need no memo entry.
+    t = type(node)
+    if t is str or t is int or node is None or t is float or t is bool:
+        return node
+
+    cached = memo.get(idx, memo)
+    if cached is not memo:
+        return None if cached is _NUXT_IN_PROGRESS else cached
+    memo[idx] = _NUXT_IN_PROGRESS
+
+    # Nuxt 3 payloads are mostly lists, so test them before dicts
+    if t is list:
+        result = _resolve_nuxt_list(arr, node, memo)
+    elif t is dict:
         result = {}
         for k, v in node.items():
             if isinstance(v, int):
-                result[k] = _resolve_nuxt_node(arr, v, depth + 1)
+                result[k] = _resolve_nuxt_node(arr, v, memo)
             else:
                 result[k] = v
-        return result
-
-    if isinstance(node, list):
-        if not node:
-            return []
-        first = node[0]
-        if isinstance(first, str):
-            if first in ("Ref", "EmptyRef", "EmptyShallowRef", "ShallowReactive", "Reactive"):
-                return _resolve_nuxt_node(arr, node[1], depth + 1) if len(node) > 1 else None
-            if first == "Set":
-                return [_resolve_nuxt_node(arr, v, depth + 1) for v in node[1:]]
-            if first == "null":
-                # dict-as-list: ["null", key1, val_idx1, key2, val_idx2, ...]
-                result = {}
-                for i in range(1, len(node) - 1, 2):
-                    k = node[i]
-                    v = node[i + 1]
-                    result[k] = _resolve_nuxt_node(arr, v, depth + 1) if isinstance(v, int) else v
-                return result
-        # Regular list — resolve each element
-        return [
-            _resolve_nuxt_node(arr, v, depth + 1) if isinstance(v, int) else v
-            for v in node
-        ]
-
-    # Leaf value (string, number, bool, null)
-    return node
+    else:
+        result = node
 
+    memo[idx] = result
+    return result
 
-def _find_item_in_data(data: object, item_id: int, depth: int = 0) -> dict | None:
-    """Recursively search for the item object matching item_id."""
-    if depth > 25:
-        return None
 
-    if isinstance(data, dict):
-        if data.get("id") == item_id and ("title" in data or "description" in data):
-            return data
-        for v in data.values():
-            found = _find_item_in_data(v, item_id, depth + 1)
-            if found:
-                return found
+def _resolve_nuxt_list(arr: list, node: list, memo: dict) -> object:
+    if not node:
+        return []
+    first = node[0]
+    if isinstance(first, str):
+        if first in ("Ref", "EmptyRef", "EmptyShallowRef", "ShallowReactive", "Reactive"):
+            return _resolve_nuxt_node(arr, node[1], memo) if len(node) > 1 else None
+        if first == "Set":
+            return [_resolve_nuxt_node(arr, v, memo) for v in node[1:]]
+        if first == "null":
+            # dict-as-list: ["null", key1, val_idx1, key2, val_idx2, ...]
+            result = {}
+            for i in range(1, len(node) - 1, 2):
+                k = node[i]
+                v = node[i + 1]
+                result[k] = _resolve_nuxt_node(arr, v, memo) if isinstance(v, int) else v
+            return result
+    # Regular list — resolve each element
+    return [
+        _resolve_nuxt_node(arr, v, memo) if isinstance(v, int) else v
+        for v in node
+    ]
 
-    elif isinstance(data, list):
-        for v in data:
-            found = _find_item_in_data(v, item_id, depth + 1)
-            if found:
-                return found
 
+def _find_item_in_data(data: object, item_id: int) -> dict | None:
+    """Breadth-first search for the item object matching item_id.
+    Shared subtrees are visited once, so cyclic payloads terminate."""
+    queue = deque([data])
+    seen: set[int] = set()
+    while queue:
+        node = queue.popleft()
+        if isinstance(node, dict):
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
+            if node.get("id") == item_id and ("title" in node or "description" in node):
+                return node
+            queue.extend(node.values())
+        elif isinstance(node, list):
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
+            queue.extend(node)
     return None
 
 
+# Schema.org itemCondition URL -> Vinted status_id
+_SCHEMA_CONDITION_MAP: dict[str, int] = {
+    "https://schema.org/NewCondition": 6,
+    "https://schema.org/UsedCondition": 3,
+    "https://schema.org/RefurbishedCondition": 2,
+}
+
+
 def _schema_org_to_item(schema: dict, item_id: int) -> dict:
     """Convert Schema.org Product markup into Vinted-like item dict."""
     item: dict = {"id": item_id, "title": schema.get("name", "")}
@@ -1722,14 +2420,9 @@ def _schema_org_to_item(schema: dict, item_id: int) -> dict:
     if isinstance(brand, dict):
         item["brand"] = brand.get("name", "")
 
-    condition_map = {
-        "https://schema.org/NewCondition": 6,
-        "https://schema.org/UsedCondition": 3,
-        "https://schema.org/RefurbishedCondition": 2,
-    }
-    item_condition = schema.get("itemCondition", "")
-    if item_condition in condition_map:
-        item["status_id"] = condition_map[item_condition]
+    status_id = _SCHEMA_CONDITION_MAP.get(schema.get("itemCondition", ""))
+    if status_id is not None:
+        item["status_id"] = status_id
 
     images = schema.get("image", [])
     if isinstance(images, list):
@@ -1743,6 +2436,53 @@ def _schema_org_to_item(schema: dict, item_id: int) -> dict:
 # ─── Photo Upload ────────────────────────────────────────────────────────────
 
 
+def _fast_uuid4() -> str:
+    """Random RFC 4122 version-4 UUID string, same format as str(uuid.uuid4())
+    without building a uuid.UUID object (temp/session ids are needed per photo)."""
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40
+    b[8] = (b[8] & 0x3F) | 0x80
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def _upload_photo_request(
+    cookie: str,
+    image_bytes: bytes,
+    temp_uuid: str | None,
+    csrf_token: str | None,
+    anon_id: str | None,
+    proxy: str | None,
+    transport_mode: str | None,
+    user_agent: str | None,
+) -> dict:
+    photo_uuid = temp_uuid or _fast_uuid4()
+
+    headers = _build_headers(cookie, f"{BASE_URL}/items/new", transport_mode, user_agent=user_agent)
+    # Remove Content-Type — curl_cffi sets it with boundary for multipart
+    headers.pop("Content-Type", None)
+    if csrf_token:
+        headers["x-csrf-token"] = csrf_token
+    if anon_id:
+        headers["x-anon-id"] = anon_id
+
+    # curl_cffi >= 0.14.0 expects multipart=CurlMime()
+    mp = CurlMime()
+    mp.addpart(name="photo[type]", data=b"item")
+    mp.addpart(name="photo[file]", content_type="image/jpeg", filename="photo.jpg", data=image_bytes)
+    mp.addpart(name="photo[temp_uuid]", data=photo_uuid.encode('utf-8'))
+
+    req_kwargs: dict = {
+        "url": f"{BASE_URL}/api/v2/photos",
+        "headers": headers,
+        "multipart": mp,
+        "timeout": 60,
+    }
+    if proxy and transport_mode != "DIRECT":
+        req_kwargs["proxy"] = proxy
+    return req_kwargs
+
+
 def upload_photo(
     cookie: str,
     image_bytes: bytes,
@@ -1759,70 +2499,117 @@ def upload_photo(
     Fields: photo[type]="item", photo[file]=(binary), photo[temp_uuid]=(uuid)
     Returns photo object with id, url, thumbnails, etc.
     """
-    api_url = f"{BASE_URL}/api/v2/photos"
-    photo_uuid = temp_uuid or str(uuid.uuid4())
-
     if session is None:
         session = _get_session(cookie, proxy, transport_mode)
 
-    headers = _build_headers(cookie, f"{BASE_URL}/items/new", transport_mode, user_agent=user_agent)
-    # Remove Content-Type — curl_cffi sets it with boundary for multipart
-    headers.pop("Content-Type", None)
-    if csrf_token:
-        headers["x-csrf-token"] = csrf_token
-    if anon_id:
-        headers["x-anon-id"] = anon_id
-
-    # curl_cffi >= 0.14.0 expects multipart=CurlMime()
-    mp = CurlMime()
-    mp.addpart(name="photo[type]", data=b"item")
-    mp.addpart(name="photo[file]", content_type="image/jpeg", filename="photo.jpg", data=image_bytes)
-    mp.addpart(name="photo[temp_uuid]", data=photo_uuid.encode('utf-8'))
-
-    req_kwargs: dict = {
-        "url": api_url,
-        "headers": headers,
-        "multipart": mp,
-        "timeout": 60,
-    }
-    if proxy and transport_mode != "DIRECT":
-        req_kwargs["proxy"] = proxy
+    def _send():
+        # A CurlMime is consumed by the request it was sent with, so a
+        # retried upload builds a fresh multipart body
+        req_kwargs = _upload_photo_request(cookie, image_bytes, temp_uuid, csrf_token, anon_id, proxy, transport_mode, user_agent)
+        try:
+            return session.post(**req_kwargs)
+        finally:
+            req_kwargs["multipart"].close()
 
     try:
-        resp = session.post(**req_kwargs)
+        resp = _request_with_backoff(_send)
     except requests.errors.RequestsError as e:
         raise VintedError("REQUEST_FAILED", str(e))
     except Exception as e:
         raise VintedError("UNKNOWN", str(e))
-    finally:
-        mp.close()
 
     return _handle_response(resp, allow_statuses=(200, 201), proxy=proxy)
 
 
-# ─── Listing CRUD ────────────────────────────────────────────────────────────
-
-
-def create_listing(
+async def upload_photo_async(
     cookie: str,
-    item_data: dict,
-    upload_session_id: str | None = None,
+    image_bytes: bytes,
+    temp_uuid: str | None = None,
     csrf_token: str | None = None,
     anon_id: str | None = None,
     proxy: str | None = None,
-    session: requests.Session | None = None,
+    session: requests.AsyncSession | None = None,
     transport_mode: str | None = None,
     user_agent: str | None = None,
 ) -> dict:
-    """
-    POST /api/v2/item_upload/items — create and publish a new listing.
-    item_data should contain all listing fields (title, description, price, etc.).
-    """
-    api_url = f"{BASE_URL}/api/v2/item_upload/items"
-    session_id = upload_session_id or str(uuid.uuid4())
-
+    """Async variant of upload_photo(); defaults to the pooled AsyncSession."""
     if session is None:
-        session = _get_session(cookie, proxy, transport_mode)
+        session = _get_async_session(cookie, proxy, transport_mode)
+
+    async def _send():
+        req_kwargs = _upload_photo_request(cookie, image_bytes, temp_uuid, csrf_token, anon_id, proxy, transport_mode, user_agent)
+        try:
+            return await session.post(**req_kwargs)
+        finally:
+            req_kwargs["multipart"].close()
+
+    try:
+        resp = await _request_with_backoff_async(_send)
+    except requests.errors.RequestsError as e:
+        raise VintedError("REQUEST_FAILED", str(e))
+    except Exception as e:
+        raise VintedError("UNKNOWN", str(e))
+
+    return _handle_response(resp, allow_statuses=(200, 201), proxy=proxy)
+
+
+# ─── Debug Dumps ─────────────────────────────────────────────────────────────
+# edit_listing snapshots its photo lookup and failed responses to /tmp for
+# troubleshooting. Encoding and writing happen on a daemon thread; the request
+# path only appends to a bounded deque. Writes are batched every 500ms and
+# only the latest snapshot per file is written (same "w" semantics as before).
+
+_DEBUG_DUMP_INTERVAL = 0.5
+_debug_dump_buf: deque = deque(maxlen=256)
+_debug_dump_wake = threading.Event()
+_debug_dump_thread: threading.Thread | None = None
+_debug_dump_lock = threading.Lock()
+
+
+def _debug_dump_worker() -> None:
+    while True:
+        _debug_dump_wake.wait()
+        time.sleep(_DEBUG_DUMP_INTERVAL)
+        _debug_dump_wake.clear()
+        latest: dict[str, object] = {}
+        while _debug_dump_buf:
+            path, data = _debug_dump_buf.popleft()
+            latest[path] = data
+        for path, data in latest.items():
+            try:
+                with open(path, "w") as f:
+                    json.dump(data, f, indent=2, default=str)
+            except Exception:
+                pass
+
+
+def _debug_dump(path: str, data: object) -> None:
+    """Queue a JSON debug snapshot for `path` (written in the background)."""
+    global _debug_dump_thread
+    _debug_dump_buf.append((path, data))
+    if _debug_dump_thread is None:
+        with _debug_dump_lock:
+            if _debug_dump_thread is None:
+                _debug_dump_thread = threading.Thread(target=_debug_dump_worker, name="vinted-debug-dump", daemon=True)
+                _debug_dump_thread.start()
+    _debug_dump_wake.set()
+
+
+# ─── Listing CRUD ────────────────────────────────────────────────────────────
+
+
+def _create_listing_request(
+    cookie: str,
+    item_data: dict,
+    upload_session_id: str | None,
+    csrf_token: str | None,
+    anon_id: str | None,
+    proxy: str | None,
+    transport_mode: str | None,
+    user_agent: str | None,
+) -> dict:
+    api_url = f"{BASE_URL}/api/v2/item_upload/items"
+    session_id = upload_session_id or _fast_uuid4()
 
     headers = _build_write_headers(
         cookie, csrf_token, anon_id,
@@ -1846,14 +2633,67 @@ def create_listing(
     req_kwargs: dict = {
         "url": api_url,
         "headers": headers,
-        "json": payload,
+        "data": _json_dumps(payload),
         "timeout": 30,
     }
     if proxy and transport_mode != "DIRECT":
         req_kwargs["proxy"] = proxy
+    return req_kwargs
+
+
+def create_listing(
+    cookie: str,
+    item_data: dict,
+    upload_session_id: str | None = None,
+    csrf_token: str | None = None,
+    anon_id: str | None = None,
+    proxy: str | None = None,
+    session: requests.Session | None = None,
+    transport_mode: str | None = None,
+    user_agent: str | None = None,
+) -> dict:
+    """
+    POST /api/v2/item_upload/items — create and publish a new listing.
+    item_data should contain all listing fields (title, description, price, etc.).
+    """
+    if session is None:
+        session = _get_session(cookie, proxy, transport_mode)
+
+    req_kwargs = _create_listing_request(
+        cookie, item_data, upload_session_id, csrf_token, anon_id, proxy, transport_mode, user_agent,
+    )
 
     try:
-        resp = session.post(**req_kwargs)
+        resp = _request_with_backoff(session.post, **req_kwargs)
+    except requests.errors.RequestsError as e:
+        raise VintedError("REQUEST_FAILED", str(e))
+    except Exception as e:
+        raise VintedError("UNKNOWN", str(e))
+
+    return _handle_response(resp, allow_statuses=(200, 201), proxy=proxy)
+
+
+async def create_listing_async(
+    cookie: str,
+    item_data: dict,
+    upload_session_id: str | None = None,
+    csrf_token: str | None = None,
+    anon_id: str | None = None,
+    proxy: str | None = None,
+    session: requests.AsyncSession | None = None,
+    transport_mode: str | None = None,
+    user_agent: str | None = None,
+) -> dict:
+    """Async variant of create_listing(); defaults to the pooled AsyncSession."""
+    if session is None:
+        session = _get_async_session(cookie, proxy, transport_mode)
+
+    req_kwargs = _create_listing_request(
+        cookie, item_data, upload_session_id, csrf_token, anon_id, proxy, transport_mode, user_agent,
+    )
+
+    try:
+        resp = await _request_with_backoff_async(session.post, **req_kwargs)
     except requests.errors.RequestsError as e:
         raise VintedError("REQUEST_FAILED", str(e))
     except Exception as e:
@@ -1878,7 +2718,7 @@ def edit_listing(
     PUT /api/v2/item_upload/items/{item_id} — edit an existing listing.
     """
     api_url = f"{BASE_URL}/api/v2/item_upload/items/{item_id}"
-    session_id = upload_session_id or str(uuid.uuid4())
+    session_id = upload_session_id or _fast_uuid4()
 
     if session is None:
         session = _get_session(cookie, proxy, transport_mode)
@@ -1895,7 +2735,6 @@ def edit_listing(
     # HAR-verified: assigned_photos is REQUIRED. Use the same authenticated session
     # to fetch the item's photo IDs from Vinted's API before the PUT.
     if "assigned_photos" not in item_data:
-        import json as _json
         photo_debug = {"item_id": item_id, "status": "starting"}
         try:
             # Use a SEPARATE session for photo fetch to avoid contaminating the edit session
@@ -1923,7 +2762,7 @@ def edit_listing(
             assigned = []
             if api_resp.status_code == 200:
                 try:
-                    api_data = api_resp.json()
+                    api_data = _json_loads(api_resp.content)
                     photo_debug["api_resp_keys"] = list(api_data.keys()) if isinstance(api_data, dict) else "not_dict"
                     
                     item_obj = api_data.get("item", api_data) if isinstance(api_data, dict) else {}
@@ -1961,11 +2800,7 @@ def edit_listing(
             photo_debug["error"] = str(e)
             photo_debug["error_type"] = type(e).__name__
             print(f"[edit_listing] ⚠️ Photo ID auto-fetch failed: {e}")
-        try:
-            with open("/tmp/vinted_photo_fetch_debug.json", "w") as f:
-                _json.dump(photo_debug, f, indent=2, default=str)
-        except Exception:
-            pass
+        _debug_dump("/tmp/vinted_photo_fetch_debug.json", photo_debug)
 
     payload = {
         "item": {
@@ -1981,21 +2816,20 @@ def edit_listing(
     req_kwargs: dict = {
         "url": api_url,
         "headers": headers,
-        "json": payload,
+        "data": _json_dumps(payload),
         "timeout": 30,
     }
     if proxy and transport_mode != "DIRECT":
         req_kwargs["proxy"] = proxy
 
     try:
-        resp = session.put(**req_kwargs)
+        resp = _request_with_backoff(session.put, **req_kwargs)
     except requests.errors.RequestsError as e:
         raise VintedError("REQUEST_FAILED", str(e))
     except Exception as e:
         raise VintedError("UNKNOWN", str(e))
 
     if resp.status_code != 200:
-        import json as _json
         debug_data = {
             "status_code": resp.status_code,
             "response_text": resp.text[:3000],
@@ -2005,36 +2839,22 @@ def edit_listing(
             "payload_keys": list(payload.get('item', {}).keys()),
             "full_payload": payload,
         }
-        try:
-            with open("/tmp/vinted_edit_debug.json", "w") as f:
-                _json.dump(debug_data, f, indent=2, default=str)
-        except Exception:
-            pass
+        _debug_dump("/tmp/vinted_edit_debug.json", debug_data)
         print(f"[edit_listing] ❌ Response {resp.status_code}: {resp.text[:2000]}")
         print(f"[edit_listing] 📦 Debug written to /tmp/vinted_edit_debug.json")
 
     return _handle_response(resp, allow_statuses=(200,), proxy=proxy)
 
 
-def delete_listing(
+def _delete_listing_request(
     cookie: str,
     item_id: int,
-    csrf_token: str | None = None,
-    anon_id: str | None = None,
-    proxy: str | None = None,
-    session: requests.Session | None = None,
-    transport_mode: str | None = None,
-    user_agent: str | None = None,
+    csrf_token: str | None,
+    anon_id: str | None,
+    proxy: str | None,
+    transport_mode: str | None,
+    user_agent: str | None,
 ) -> dict:
-    """
-    POST /api/v2/items/{item_id}/delete — delete a live listing.
-    Empty body; uses POST (not DELETE method).
-    """
-    api_url = f"{BASE_URL}/api/v2/items/{item_id}/delete"
-
-    if session is None:
-        session = _get_session(cookie, proxy, transport_mode)
-
     headers = _build_write_headers(
         cookie, csrf_token, anon_id,
         referer=f"{BASE_URL}/items/{item_id}",
@@ -2046,15 +2866,62 @@ def delete_listing(
     headers["Content-Length"] = "0"
 
     req_kwargs: dict = {
-        "url": api_url,
+        "url": f"{BASE_URL}/api/v2/items/{item_id}/delete",
         "headers": headers,
         "timeout": 30,
     }
     if proxy and transport_mode != "DIRECT":
         req_kwargs["proxy"] = proxy
+    return req_kwargs
+
+
+def delete_listing(
+    cookie: str,
+    item_id: int,
+    csrf_token: str | None = None,
+    anon_id: str | None = None,
+    proxy: str | None = None,
+    session: requests.Session | None = None,
+    transport_mode: str | None = None,
+    user_agent: str | None = None,
+) -> dict:
+    """
+    POST /api/v2/items/{item_id}/delete — delete a live listing.
+    Empty body; uses POST (not DELETE method).
+    """
+    if session is None:
+        session = _get_session(cookie, proxy, transport_mode)
+
+    req_kwargs = _delete_listing_request(cookie, item_id, csrf_token, anon_id, proxy, transport_mode, user_agent)
 
     try:
-        resp = session.post(**req_kwargs)
+        resp = _request_with_backoff(session.post, **req_kwargs)
+    except requests.errors.RequestsError as e:
+        raise VintedError("REQUEST_FAILED", str(e))
+    except Exception as e:
+        raise VintedError("UNKNOWN", str(e))
+
+    return _handle_response(resp, allow_statuses=(200,), proxy=proxy)
+
+
+async def delete_listing_async(
+    cookie: str,
+    item_id: int,
+    csrf_token: str | None = None,
+    anon_id: str | None = None,
+    proxy: str | None = None,
+    session: requests.AsyncSession | None = None,
+    transport_mode: str | None = None,
+    user_agent: str | None = None,
+) -> dict:
+    """Async variant of delete_listing(); defaults to the pooled AsyncSession."""
+    if session is None:
+        session = _get_async_session(cookie, proxy, transport_mode)
+
+    req_kwargs = _delete_listing_request(cookie, item_id, csrf_token, anon_id, proxy, transport_mode, user_agent)
+
+    try:
+        resp = await _request_with_backoff_async(session.post, **req_kwargs)
     except requests.errors.RequestsError as e:
         raise VintedError("REQUEST_FAILED", str(e))
     except Exception as e:
@@ -2089,14 +2956,14 @@ def hide_listing(
     req_kwargs: dict = {
         "url": api_url,
         "headers": headers,
-        "json": {"is_hidden": hidden},
+        "data": _json_dumps({"is_hidden": hidden}),
         "timeout": 30,
     }
     if proxy and transport_mode != "DIRECT":
         req_kwargs["proxy"] = proxy
 
     try:
-        resp = session.put(**req_kwargs)
+        resp = _request_with_backoff(session.put, **req_kwargs)
     except requests.errors.RequestsError as e:
         raise VintedError("REQUEST_FAILED", str(e))
     except Exception as e:
@@ -2107,6 +2974,36 @@ def hide_listing(
 
 # ─── Stealth Relist Orchestrator ─────────────────────────────────────────────
 
+# Concurrent mutate+upload workers per relist
+_RELIST_UPLOAD_WORKERS = 3
+
+# mutate_image is pure CPU (PIL re-encode + dHash check), so relist_item_async
+# runs it in worker processes, off the GIL, while uploads are on the wire.
+# One pool is shared across relists; spawning interpreters per call would
+# cost more than the mutations themselves.
+_MUTATE_WORKERS = min(4, os.cpu_count() or 1)
+_mutate_pool: ProcessPoolExecutor | None = None
+_mutate_pool_lock = threading.Lock()
+
+
+def _get_mutate_pool() -> ProcessPoolExecutor:
+    global _mutate_pool
+    with _mutate_pool_lock:
+        if _mutate_pool is None:
+            _mutate_pool = ProcessPoolExecutor(max_workers=_MUTATE_WORKERS)
+    return _mutate_pool
+
+
+@atexit.register
+def shutdown_mutate_pool() -> None:
+    """Stop the mutation worker processes. Runs at interpreter exit; the
+    bridge also calls it on server shutdown."""
+    global _mutate_pool
+    with _mutate_pool_lock:
+        pool, _mutate_pool = _mutate_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
 
 def relist_item(
     cookie: str,
@@ -2120,6 +3017,37 @@ def relist_item(
     transport_mode: str | None = None,
     user_agent: str | None = None,
     skip_delete: bool = False,
+) -> dict:
+    """relist_item_async() for sync callers, on a private event loop. The
+    relist session pooled on that loop is closed with it."""
+
+    async def _run() -> dict:
+        try:
+            return await relist_item_async(
+                cookie, old_item_id, item_data, image_bytes_list, relist_count,
+                csrf_token, anon_id, proxy, transport_mode, user_agent, skip_delete,
+            )
+        finally:
+            with _session_pool_lock:
+                sessions = _relist_session_pool.pop(asyncio.get_running_loop(), {})
+            for session in sessions.values():
+                await session.close()
+
+    return asyncio.run(_run())
+
+
+async def relist_item_async(
+    cookie: str,
+    old_item_id: int,
+    item_data: dict,
+    image_bytes_list: list[bytes],
+    relist_count: int,
+    csrf_token: str | None = None,
+    anon_id: str | None = None,
+    proxy: str | None = None,
+    transport_mode: str | None = None,
+    user_agent: str | None = None,
+    skip_delete: bool = False,
 ) -> dict:
     """
     Full stealth relist sequence under a single sticky proxy session:
@@ -2129,6 +3057,15 @@ def relist_item(
       4. Create + publish new listing with mutated text & new photo IDs
       5. Return new item data
 
+    Mutation and upload are pipelined: a producer mutates photos in worker
+    processes and queues them, while _RELIST_UPLOAD_WORKERS consumers upload
+    concurrently with a small human delay each. Photo N+1 is being mutated
+    while photo N is on the wire. Once any upload fails the rest are
+    abandoned, so no orphan photos are created. Uploads, delete and create
+    all go through one pooled relist AsyncSession — same proxy, impersonation
+    target and cookie jar throughout — with the 10s wait between delete and
+    create awaited on the loop.
+
     Args:
         cookie: Full Vinted session cookie string.
         old_item_id: The current live Vinted item ID to delete.
@@ -2141,96 +3078,193 @@ def relist_item(
         transport_mode: 'PROXY' or 'DIRECT' for hybrid transport.
 
     Returns:
-        dict with {new_item_id, photo_ids, upload_session_id}
+        dict with {new_item, photo_ids, upload_session_id, delete_succeeded}
     """
-    # Single session for IP consistency — use mode-appropriate impersonate target
-    imp = IMPOSTOR
-    sticky_session = requests.Session(impersonate=imp)
+    # Imported here rather than at module level: image_mutator pulls in
+    # Pillow and NumPy, which only relists need, and which would otherwise
+    # slow every bridge start.
+    from image_mutator import mutate_image
+
+    imp = _current_impostor()
+    upload_session_id = _fast_uuid4()
+    loop = asyncio.get_running_loop()
+    pool = _get_mutate_pool()
+    # Bounded, and the producer submits at most as many mutations ahead of it,
+    # so only a few mutated photos wait in memory ahead of the uploaders
+    queue: asyncio.Queue = asyncio.Queue(maxsize=_RELIST_UPLOAD_WORKERS * 2)
+    uploaded: list[int | None] = [None] * len(image_bytes_list)
+
+    async def _produce():
+        # Keep a window of mutations running in the pool and queue them in
+        # source order as they complete; the next one is submitted only once
+        # the oldest has been handed to the queue
+        futures: deque = deque()
+
+        async def _hand_off():
+            index, fut = futures[0]
+            await queue.put((index, await fut))
+            futures.popleft()
+
+        try:
+            for index, b in enumerate(image_bytes_list):
+                futures.append((index, loop.run_in_executor(pool, mutate_image, b, relist_count)))
+                if len(futures) >= queue.maxsize:
+                    await _hand_off()
+            while futures:
+                await _hand_off()
+        finally:
+            for _, fut in futures:
+                fut.cancel()
+            # Running mutations can't be cancelled; wait them out so none is
+            # left unretrieved when the relist ends
+            await asyncio.gather(*(fut for _, fut in futures), return_exceptions=True)
+        for _ in range(_RELIST_UPLOAD_WORKERS):
+            await queue.put(None)
+
+    # Single session for IP consistency, shared with earlier relists through
+    # the same proxy and impersonation target
+    sticky_session = _get_relist_session(proxy, transport_mode, imp)
     _inject_cookies(sticky_session, cookie)
-    upload_session_id = str(uuid.uuid4())
 
     # ── Step 1: Mutate and upload all images ──
-    photo_ids = []
-    for img_bytes in image_bytes_list:
-        mutated = mutate_image(img_bytes, relist_count)
-        photo_uuid = str(uuid.uuid4())
-        result = upload_photo(
-            cookie=cookie,
-            image_bytes=mutated,
-            temp_uuid=photo_uuid,
-            csrf_token=csrf_token,
-            anon_id=anon_id,
-            proxy=proxy,
-            session=sticky_session,
-            transport_mode=transport_mode,
-            user_agent=user_agent,
+    async def _consume():
+        while (job := await queue.get()) is not None:
+            index, mutated = job
+            del job
+            # Small delay before each upload to mimic human behavior
+            await asyncio.sleep(random.uniform(0.3, 0.8))
+            result = await upload_photo_async(
+                cookie=cookie,
+                image_bytes=mutated,
+                temp_uuid=_fast_uuid4(),
+                csrf_token=csrf_token,
+                anon_id=anon_id,
+                proxy=proxy,
+                session=sticky_session,
+                transport_mode=transport_mode,
+                user_agent=user_agent,
+            )
+            del mutated
+            # Slot by source index so photo order matches the original
+            uploaded[index] = result.get("id")
+
+    try:
+        tasks = [asyncio.ensure_future(_produce())]
+        tasks += [asyncio.ensure_future(_consume()) for _ in range(_RELIST_UPLOAD_WORKERS)]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            # A failed upload must not leave the producer parked on a full queue
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        raw_ids: list[int] = [pid for pid in uploaded if pid]
+
+        return await _relist_publish_async(
+            cookie, old_item_id, item_data, raw_ids, relist_count, upload_session_id,
+            csrf_token, anon_id, proxy, transport_mode, user_agent, skip_delete, sticky_session,
         )
-        photo_id = result.get("id")
-        if photo_id:
-            photo_ids.append({"id": photo_id, "orientation": 0})
-        # Small delay between uploads to mimic human behavior
-        time.sleep(random.uniform(0.3, 0.8))
+    except VintedError as e:
+        if e.status_code == 403:
+            _discard_relist_session(sticky_session)
+        raise
 
-    if not photo_ids:
-        raise VintedError("UPLOAD_FAILED", "No photos were uploaded successfully")
 
-    # ── Step 2: Delete old listing ──
-    delete_succeeded = True
-    if skip_delete:
-        print(f"[relist] ℹ️ skip_delete=True — skipping delete for item {old_item_id}")
-        delete_succeeded = False
-    else:
+async def _relist_publish_async(
+    cookie: str,
+    old_item_id: int,
+    item_data: dict,
+    raw_ids: list[int],
+    relist_count: int,
+    upload_session_id: str,
+    csrf_token: str | None,
+    anon_id: str | None,
+    proxy: str | None,
+    transport_mode: str | None,
+    user_agent: str | None,
+    skip_delete: bool,
+    session: requests.AsyncSession,
+) -> dict:
+    """Steps 2–4 of a relist, once the new photos are uploaded. The 10s wait
+    holds no thread."""
+    delete_succeeded = False
+    if _relist_should_delete(old_item_id, raw_ids, skip_delete):
         try:
-            delete_listing(
+            await delete_listing_async(
                 cookie=cookie,
                 item_id=old_item_id,
                 csrf_token=csrf_token,
                 anon_id=anon_id,
                 proxy=proxy,
-                session=sticky_session,
+                session=session,
                 transport_mode=transport_mode,
                 user_agent=user_agent,
             )
         except VintedError as e:
-            raise VintedError(
-                "DELETE_BLOCKED",
-                f"Old listing cannot be deleted (likely under review): [{e.code}] {e.message}",
-                e.status_code,
-            )
+            raise _relist_delete_blocked(e)
+        delete_succeeded = True
 
     # ── Step 3: Wait 10 seconds (delete-post jitter) ──
-    time.sleep(10)
-
-    # ── Step 4: Create + publish new listing with mutated text ──
-    # Apply whitespace jitter to title and description
-    mutated_data = dict(item_data)
-    if "title" in mutated_data:
-        mutated_data["title"] = jitter_text(mutated_data["title"], relist_count)
-    if "description" in mutated_data:
-        mutated_data["description"] = jitter_text(
-            mutated_data["description"] or "", relist_count
-        )
+    await asyncio.sleep(10)
 
-    # Replace photo references with newly uploaded ones
-    mutated_data["assigned_photos"] = photo_ids
-    mutated_data["temp_uuid"] = upload_session_id
-
-    result = create_listing(
+    result = await create_listing_async(
         cookie=cookie,
-        item_data=mutated_data,
+        item_data=_relist_item_data(item_data, raw_ids, relist_count, upload_session_id),
         upload_session_id=upload_session_id,
         csrf_token=csrf_token,
         anon_id=anon_id,
         proxy=proxy,
-        session=sticky_session,
+        session=session,
         transport_mode=transport_mode,
         user_agent=user_agent,
     )
+    return _relist_result(result, raw_ids, upload_session_id, delete_succeeded)
+
+
+def _relist_should_delete(old_item_id: int, raw_ids: list[int], skip_delete: bool) -> bool:
+    """Step 2 gate: never delete the old listing without replacement photos."""
+    if not raw_ids:
+        raise VintedError("UPLOAD_FAILED", "No photos were uploaded successfully")
+
+    # ── Step 2: Delete old listing ──
+    if skip_delete:
+        print(f"[relist] ℹ️ skip_delete=True — skipping delete for item {old_item_id}")
+        return False
+    return True
+
+
+def _relist_delete_blocked(e: VintedError) -> VintedError:
+    return VintedError(
+        "DELETE_BLOCKED",
+        f"Old listing cannot be deleted (likely under review): [{e.code}] {e.message}",
+        e.status_code,
+    )
 
+
+def _relist_item_data(item_data: dict, raw_ids: list[int], relist_count: int, upload_session_id: str) -> dict:
+    """Step 4 payload: the source listing with jittered text and the new photos."""
+    from image_mutator import jitter_text
+
+    # ── Step 4: Create + publish new listing with mutated text ──
+    # Apply whitespace jitter to title and description
+    # and replace photo references with the newly uploaded ones
+    overrides: dict = {
+        "assigned_photos": [{"id": pid, "orientation": 0} for pid in raw_ids],
+        "temp_uuid": upload_session_id,
+    }
+    if "title" in item_data:
+        overrides["title"] = jitter_text(item_data["title"], relist_count)
+    if "description" in item_data:
+        overrides["description"] = jitter_text(item_data["description"] or "", relist_count)
+    return item_data | overrides
+
+
+def _relist_result(new_item: dict, raw_ids: list[int], upload_session_id: str, delete_succeeded: bool) -> dict:
     return {
         "ok": True,
-        "new_item": result,
-        "photo_ids": [p["id"] for p in photo_ids],
+        "new_item": new_item,
+        "photo_ids": raw_ids,
         "upload_session_id": upload_session_id,
         "delete_succeeded": delete_succeeded,
     }
@@ -2304,13 +3338,15 @@ def orchestrate_relist(
     Returns:
         dict with {ok, new_item, photo_ids, upload_session_id}
     """
+    from image_mutator import mutate_image_for_relist, jitter_text_zwsp
+
     # Single sticky session for the entire sequence
-    imp = IMPOSTOR
+    imp = _current_impostor()
     sticky_session = requests.Session(impersonate=imp)
     # Inject cookies into the session jar — critical after the cookie-jar refactoring
     # that removed Cookie headers from _build_headers.
     _inject_cookies(sticky_session, cookie)
-    upload_session_id = str(uuid.uuid4())
+    upload_session_id = _fast_uuid4()
 
     # ── Step 1-3: Download, mutate, and upload all images ──
     photo_ids = []
@@ -2320,9 +3356,10 @@ def orchestrate_relist(
 
         # Step 2: Mutate with generation-based mutations (includes dHash verification)
         mutated_bytes = mutate_image_for_relist(raw_bytes, relist_count)
+        del raw_bytes
 
         # Step 3: Upload mutated image
-        photo_uuid = str(uuid.uuid4())
+        photo_uuid = _fast_uuid4()
         try:
             result = upload_photo(
                 cookie=cookie,
@@ -2347,6 +3384,8 @@ def orchestrate_relist(
                 )
             raise  # Re-raise non-Datadome errors
 
+        del mutated_bytes
+
         photo_id = result.get("id")
         if photo_id:
             photo_ids.append({"id": photo_id, "orientation": 0})
@@ -2393,15 +3432,11 @@ def orchestrate_relist(
 
     # ── Step 6: Jitter description with zero-width spaces ──
     # NOTE: Title is NOT jittered — Vinted's API rejects special characters in titles.
-    mutated_data = dict(item_data)
-    if "description" in mutated_data:
-        mutated_data["description"] = jitter_text_zwsp(
-            mutated_data["description"] or "", relist_count
-        )
-
-    # Replace photo references with newly uploaded ones
-    mutated_data["assigned_photos"] = photo_ids
-    mutated_data["temp_uuid"] = upload_session_id
+    # and replace photo references with the newly uploaded ones
+    overrides: dict = {"assigned_photos": photo_ids, "temp_uuid": upload_session_id}
+    if "description" in item_data:
+        overrides["description"] = jitter_text_zwsp(item_data["description"] or "", relist_count)
+    mutated_data = item_data | overrides
 
     # ── Step 7: Create new listing ──
     result = create_listing(
@@ -2425,6 +3460,16 @@ def orchestrate_relist(
     }
 
 
+# Markers of a Datadome/Cloudflare interstitial in a (lowercased) HTML body
+_HEALTH_CHALLENGE_SIGNATURES = (
+    b"datadome",
+    b"captcha-delivery.com",
+    b"geo.captcha-delivery",
+    b"just a moment",
+    b"<!doctype",
+)
+
+
 def _verify_session_health(
     cookie: str,
     session: requests.Session,
@@ -2462,16 +3507,10 @@ def _verify_session_health(
     # Check for 200 with HTML challenge body (Datadome returns 200 + HTML sometimes)
     content_type = resp.headers.get("content-type", "")
     if "text/html" in content_type:
-        body_start = resp.text[:500].lower()
-        datadome_signatures = [
-            "datadome",
-            "captcha-delivery.com",
-            "geo.captcha-delivery",
-            "just a moment",
-            "<!doctype",
-        ]
-        if any(sig in body_start for sig in datadome_signatures):
+        body_start = resp.content[:512].lower()
+        if any(sig in body_start for sig in _HEALTH_CHALLENGE_SIGNATURES):
             reset_session(proxy, transport_mode)
+            _note_cf_challenge()
             raise VintedError(
                 "DATADOME_CHALLENGE",
                 "Datadome HTML challenge detected on health check. "
@@ -2568,7 +3607,7 @@ def send_message(
     req_kwargs: dict = {
         "url": api_url,
         "headers": headers,
-        "json": payload,
+        "data": _json_dumps(payload),
         "timeout": 30,
     }
     if proxy and transport_mode != "DIRECT":
@@ -2621,7 +3660,7 @@ def send_offer(
     req_kwargs: dict = {
         "url": api_url,
         "headers": headers,
-        "json": payload,
+        "data": _json_dumps(payload),
         "timeout": 30,
     }
     if proxy and transport_mode != "DIRECT":
@@ -2677,7 +3716,7 @@ def initiate_conversation(
     req_kwargs: dict = {
         "url": api_url,
         "headers": headers,
-        "json": payload,
+        "data": _json_dumps(payload),
         "timeout": 30,
     }
     if proxy and transport_mode != "DIRECT":
@@ -2729,7 +3768,7 @@ def create_buy_conversation(
     req_kwargs: dict = {
         "url": api_url,
         "headers": headers,
-        "json": payload,
+        "data": _json_dumps(payload),
         "timeout": 30,
     }
     if proxy and transport_mode != "DIRECT":
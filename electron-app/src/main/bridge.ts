@@ -535,6 +535,31 @@ export async function fetchOntologyBrands(
   }
 }
 
+/**
+ * Fetch categories, colors and brands (plus conditions for a category) in one
+ * concurrent bridge call.
+ */
+export async function fetchOntologyBundle(catalogId?: number, proxy?: string): Promise<BridgeResult> {
+  const cookie = secureStorage.retrieveCookie();
+  if (!cookie) {
+    return { ok: false, code: 'MISSING_COOKIE', message: 'No session cookie.' };
+  }
+  const params: Record<string, string> = { transport_mode: _transportMode() };
+  if (catalogId != null) params.catalog_id = String(catalogId);
+  if (proxy) params.proxy = proxy;
+  const qs = new URLSearchParams(params).toString();
+
+  try {
+    const res = await fetch(`${BRIDGE_BASE}/ontology/bundle${qs ? '?' + qs : ''}`, {
+      method: 'GET',
+      headers: authHeaders(),
+    });
+    return (await res.json()) as BridgeResult;
+  } catch (err) {
+    return bridgeError(err);
+  }
+}
+
 /**
  * Fetch ontology colors.
  */
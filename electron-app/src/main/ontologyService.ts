@@ -30,8 +30,8 @@ export interface OntologyDiffResult {
  * Fetch and cache the category tree from Vinted.
  * Returns the diff result showing what changed.
  */
-export async function refreshCategories(): Promise<OntologyDiffResult | null> {
-  const result = await bridge.fetchOntologyCategories();
+export async function refreshCategories(prefetched?: bridge.BridgeResult): Promise<OntologyDiffResult | null> {
+  const result = prefetched ?? (await bridge.fetchOntologyCategories());
   if (!result.ok) {
     logger.warn('ontology-fetch-failed', { type: 'category', error: (result as { message?: string }).message });
     return null;
@@ -76,8 +76,11 @@ export async function refreshCategories(): Promise<OntologyDiffResult | null> {
 /**
  * Fetch and cache brands from Vinted (optionally filtered by category).
  */
-export async function refreshBrands(categoryId?: number): Promise<OntologyDiffResult | null> {
-  const result = await bridge.fetchOntologyBrands(categoryId);
+export async function refreshBrands(
+  categoryId?: number,
+  prefetched?: bridge.BridgeResult,
+): Promise<OntologyDiffResult | null> {
+  const result = prefetched ?? (await bridge.fetchOntologyBrands(categoryId));
   if (!result.ok) {
     logger.warn('ontology-fetch-failed', { type: 'brand', error: (result as { message?: string }).message });
     return null;
@@ -116,8 +119,8 @@ export async function refreshBrands(categoryId?: number): Promise<OntologyDiffRe
 /**
  * Fetch and cache colors from Vinted.
  */
-export async function refreshColors(): Promise<void> {
-  const result = await bridge.fetchOntologyColors();
+export async function refreshColors(prefetched?: bridge.BridgeResult): Promise<void> {
+  const result = prefetched ?? (await bridge.fetchOntologyColors());
   if (!result.ok) return;
 
   const remoteData = (result as { data: unknown }).data;
@@ -151,12 +154,18 @@ export async function refreshColors(): Promise<void> {
  */
 export async function refreshAll(): Promise<void> {
   try {
-    const catDiff = await refreshCategories();
+    // One bridge call fetches all three concurrently; if it fails, each
+    // refresh falls back to its own endpoint
+    const bundle = await bridge.fetchOntologyBundle();
+    const part = (key: string): bridge.BridgeResult | undefined =>
+      bundle.ok ? { ok: true, data: (bundle.data as Record<string, unknown>)[key] } : undefined;
+
+    const catDiff = await refreshCategories(part('categories'));
 
     // Fire off brands and colors in parallel (non-critical)
     await Promise.allSettled([
-      refreshBrands(),
-      refreshColors(),
+      refreshBrands(undefined, part('brands')),
+      refreshColors(part('colors')),
     ]);
 
     // If category changes affected inventory items, alert the renderer